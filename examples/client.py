@@ -1,6 +1,8 @@
 import asyncio
 import json
+
 from fastmcp import Client
+
 from ultrathink.interface.mcp_server import mcp
 
 
@@ -205,86 +207,85 @@ async def test_ultrathink() -> None:
         print("🔀 Testing multi-session support...")
         print("Scenario: Working on two separate problems simultaneously\n")
 
-        # Session 1: Calculate area of circle (auto-assigned as True)
-        print("  Session 1 - Circle Area Problem:")
-        result_s1_t1 = await client.call_tool(
-            "ultrathink",
-            {
-                "thought": "Calculate area of circle with radius 5",
-                "thought_number": 1,
-                "total_thoughts": 2,
-                # next_thought_needed auto-assigned as True
-                # No session_id = create new session
-            },
-        )
-        s1_response1 = json.loads(result_s1_t1.content[0].text)
-        session_1_id = s1_response1["session_id"]
-        print(f"    Created session: {session_1_id[:8]}...")
-        print(f"    History length: {s1_response1['thought_history_length']}")
-
-        # Session 2: Calculate fibonacci (auto-assigned as True)
-        print("\n  Session 2 - Fibonacci Problem:")
-        result_s2_t1 = await client.call_tool(
-            "ultrathink",
-            {
-                "thought": "Calculate the 7th Fibonacci number",
-                "thought_number": 1,
-                "total_thoughts": 3,
-                # next_thought_needed auto-assigned as True
-                # No session_id = create another new session
-            },
-        )
-        s2_response1 = json.loads(result_s2_t1.content[0].text)
-        session_2_id = s2_response1["session_id"]
-        print(f"    Created session: {session_2_id[:8]}...")
-        print(f"    History length: {s2_response1['thought_history_length']}")
-
-        # Continue Session 1 (auto-assigned as False)
-        print("\n  Continuing Session 1:")
-        result_s1_t2 = await client.call_tool(
-            "ultrathink",
-            {
-                "thought": "Area = π × r² = π × 5² = 25π ≈ 78.54",
-                "thought_number": 2,
-                "total_thoughts": 2,
-                # next_thought_needed auto-assigned as False
-                "session_id": session_1_id,  # Continue session 1
-            },
-        )
-        s1_response2 = json.loads(result_s1_t2.content[0].text)
-        print(f"    Session: {s1_response2['session_id'][:8]}...")
-        print(f"    History length: {s1_response2['thought_history_length']}")
-
-        # Continue Session 2 (auto-assigned as True)
-        print("\n  Continuing Session 2:")
-        result_s2_t2 = await client.call_tool(
-            "ultrathink",
-            {
-                "thought": "Fibonacci: 0, 1, 1, 2, 3, 5, 8",
-                "thought_number": 2,
-                "total_thoughts": 3,
-                # next_thought_needed auto-assigned as True
-                "session_id": session_2_id,  # Continue session 2
-            },
-        )
-        s2_response2 = json.loads(result_s2_t2.content[0].text)
-        print(f"    Session: {s2_response2['session_id'][:8]}...")
-        print(f"    History length: {s2_response2['thought_history_length']}")
-
-        # Final thought for Session 2 (auto-assigned as False)
-        result_s2_t3 = await client.call_tool(
-            "ultrathink",
-            {
-                "thought": "The 7th Fibonacci number is 8",
-                "thought_number": 3,
-                "total_thoughts": 3,
-                # next_thought_needed auto-assigned as False
-                "session_id": session_2_id,
-            },
-        )
-        s2_response3 = json.loads(result_s2_t3.content[0].text)
-        print(f"    Session: {s2_response3['session_id'][:8]}...")
-        print(f"    History length: {s2_response3['thought_history_length']}")
+        async def run_circle_area_session() -> list[str]:
+            """Session 1 of the multi-session demo: area of a circle (2 thoughts)"""
+            output = ["  Session 1 - Circle Area Problem:"]
+            # Auto-assigned as True; no session_id = create new session
+            result_t1 = await client.call_tool(
+                "ultrathink",
+                {
+                    "thought": "Calculate area of circle with radius 5",
+                    "thought_number": 1,
+                    "total_thoughts": 2,
+                },
+            )
+            response1 = json.loads(result_t1.content[0].text)
+            session_id = response1["session_id"]
+            output.append(f"    Created session: {session_id[:8]}...")
+            output.append(f"    History length: {response1['thought_history_length']}")
+
+            # Continue Session 1 (auto-assigned as False)
+            output.append("\n  Continuing Session 1:")
+            result_t2 = await client.call_tool(
+                "ultrathink",
+                {
+                    "thought": "Area = π × r² = π × 5² = 25π ≈ 78.54",
+                    "thought_number": 2,
+                    "total_thoughts": 2,
+                    "session_id": session_id,  # Continue session 1
+                },
+            )
+            response2 = json.loads(result_t2.content[0].text)
+            output.append(f"    Session: {response2['session_id'][:8]}...")
+            output.append(f"    History length: {response2['thought_history_length']}")
+            return output
+
+        async def run_fibonacci_session() -> list[str]:
+            """Session 2 of the multi-session demo: Fibonacci (3 thoughts)"""
+            output = ["\n  Session 2 - Fibonacci Problem:"]
+            # Auto-assigned as True; no session_id = create another new session
+            result_t1 = await client.call_tool(
+                "ultrathink",
+                {
+                    "thought": "Calculate the 7th Fibonacci number",
+                    "thought_number": 1,
+                    "total_thoughts": 3,
+                },
+            )
+            response1 = json.loads(result_t1.content[0].text)
+            session_id = response1["session_id"]
+            output.append(f"    Created session: {session_id[:8]}...")
+            output.append(f"    History length: {response1['thought_history_length']}")
+
+            # Continue Session 2 (auto-assigned as True, then False for the final thought)
+            output.append("\n  Continuing Session 2:")
+            for thought_number, thought in (
+                (2, "Fibonacci: 0, 1, 1, 2, 3, 5, 8"),
+                (3, "The 7th Fibonacci number is 8"),
+            ):
+                result = await client.call_tool(
+                    "ultrathink",
+                    {
+                        "thought": thought,
+                        "thought_number": thought_number,
+                        "total_thoughts": 3,
+                        "session_id": session_id,  # Continue session 2
+                    },
+                )
+                response = json.loads(result.content[0].text)
+                output.append(f"    Session: {response['session_id'][:8]}...")
+                output.append(
+                    f"    History length: {response['thought_history_length']}"
+                )
+            return output
+
+        # The two sessions are independent, so their calls run concurrently.
+        # Each chain collects its output and prints it once both finish.
+        async with asyncio.TaskGroup() as tg:
+            session_1 = tg.create_task(run_circle_area_session())
+            session_2 = tg.create_task(run_fibonacci_session())
+        print("\n".join(session_1.result()))
+        print("\n".join(session_2.result()))
 
         # Test custom session ID (resilient recovery, auto-assigned as False)
         print("\n  Creating session with custom ID:")
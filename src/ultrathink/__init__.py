@@ -2,21 +2,51 @@
 UltraThink - MCP server for sequential thinking and problem-solving
 """
 
-from .models.assumption import Assumption
-from .models.thought import Thought, ThoughtRequest, ThoughtResponse
-from .models.session import ThinkingSession
-from .services.thinking_service import UltraThinkService
-from .interface.mcp_server import mcp
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .interface.mcp_server import mcp
+    from .models.assumption import Assumption
+    from .models.session import ThinkingSession
+    from .models.thought import Thought, ThoughtRequest, ThoughtResponse
+    from .services.thinking_service import UltraThinkService
 
 __all__ = [
     # Models layer
     "Assumption",
+    "ThinkingSession",
     "Thought",
     "ThoughtRequest",
     "ThoughtResponse",
-    "ThinkingSession",
     # Services layer
     "UltraThinkService",
     # Interface layer
     "mcp",
 ]
+
+# Public name -> submodule defining it; imported on first attribute access
+# (PEP 562) so `import ultrathink` does not pull in FastMCP until needed
+_EXPORTS = {
+    "Assumption": ".models.assumption",
+    "ThinkingSession": ".models.session",
+    "Thought": ".models.thought",
+    "ThoughtRequest": ".models.thought",
+    "ThoughtResponse": ".models.thought",
+    "UltraThinkService": ".services.thinking_service",
+    "mcp": ".interface.mcp_server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
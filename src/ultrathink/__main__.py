@@ -1,9 +1,45 @@
+import asyncio
+import os
+
+import fastmcp
+from fastmcp.utilities.logging import configure_logging
+
 from .interface.mcp_server import mcp
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the server's event loop, running new tasks eagerly
+
+    The loop is uvloop's when it is installed (optional `speedups` extra) and
+    asyncio's default otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+def _disable_rich_tracebacks() -> None:
+    """Log tool errors with plain tracebacks unless FASTMCP_ENABLE_RICH_TRACEBACKS is set
+
+    FastMCP logs every failed tool call with its traceback; rendering that with
+    rich dominates the cost of rejecting an invalid thought.
+    """
+    if "FASTMCP_ENABLE_RICH_TRACEBACKS" in os.environ:
+        return
+    configure_logging(level=fastmcp.settings.log_level, enable_rich_tracebacks=False)
+
+
 def main() -> None:
     """Entry point for the UltraThink MCP server"""
-    mcp.run()
+    _disable_rich_tracebacks()
+    # Same as mcp.run(), but on a loop built by _new_event_loop()
+    with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+        runner.run(mcp.run_async())
 
 
 if __name__ == "__main__":
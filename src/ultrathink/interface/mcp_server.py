@@ -240,10 +240,10 @@ def ultrathink(
     15. Repeat the process until you reach a satisfactory solution
     16. Provide a single, ideally correct answer as the final output
     """
-    # Construct ThoughtRequest from flat parameters
+    # Construct ThoughtRequest from flat parameters already validated by FastMCP
     # Note: assumptions, depends_on_assumptions, and invalidates_assumptions can be str or list
-    # The field validators in ThoughtRequest will handle string-to-list conversion
-    request = ThoughtRequest(
+    # String values are still routed through the ThoughtRequest field validators for parsing
+    request = ThoughtRequest.from_tool_arguments(
         thought=thought,
         thought_number=thought_number,
         total_thoughts=total_thoughts,
@@ -257,8 +257,35 @@ def ultrathink(
         confidence=confidence,
         uncertainty_notes=uncertainty_notes,
         outcome=outcome,
-        assumptions=assumptions,  # type: ignore[arg-type]
-        depends_on_assumptions=depends_on_assumptions,  # type: ignore[arg-type]
-        invalidates_assumptions=invalidates_assumptions,  # type: ignore[arg-type]
+        assumptions=assumptions,
+        depends_on_assumptions=depends_on_assumptions,
+        invalidates_assumptions=invalidates_assumptions,
     )
     return thinking_service.process_thought(request)
+
+
+@mcp.tool
+def ultrathink_batch(
+    thoughts: Annotated[
+        list[ThoughtRequest],
+        Field(
+            min_length=1,
+            description=(
+                "Thought steps to record in order, each with the same fields as the "
+                "ultrathink tool. A thought without session_id continues the session "
+                "of the previous thought in the list"
+            ),
+        ),
+    ],
+) -> list[ThoughtResponse]:
+    """
+    Record several ultrathink thought steps in one call.
+
+    Use this instead of repeated ultrathink calls when the next few thoughts are
+    already known (e.g. laying out a plan). Each item accepts the same fields as
+    the ultrathink tool and gets the same response; responses are returned in order.
+
+    Thoughts are processed sequentially. If one is rejected, processing stops with
+    an error and the thoughts before it remain recorded in their sessions.
+    """
+    return thinking_service.process_thoughts(thoughts)
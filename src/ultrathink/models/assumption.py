@@ -1,14 +1,25 @@
-from typing import Annotated, Literal
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Annotated, Any, Literal, Self
 from pydantic import BaseModel, Field
 
+VerificationStatus = Literal["unverified", "verified_true", "verified_false"]
+
+# Display markers for verified assumptions, keyed by verification_status
+_STATUS_MARKERS: dict[str | None, str] = {
+    "verified_true": " ✓",
+    "verified_false": " ✗",
+}
+
 
 class Assumption(BaseModel):
     """
     Model: Represents an assumption made during thinking process
     Tracks what is being taken for granted in reasoning
+    Immutable: status changes produce a new instance via with_verification_status()
     """
 
-    model_config = {"strict": True}
+    model_config = {"strict": True, "frozen": True}
 
     id: Annotated[
         str,
@@ -48,7 +59,7 @@ class Assumption(BaseModel):
         ),
     ] = None
     verification_status: Annotated[
-        Literal["unverified", "verified_true", "verified_false"] | None,
+        VerificationStatus | None,
         Field(None, description="Whether this assumption has been verified"),
     ] = None
 
@@ -71,24 +82,41 @@ class Assumption(BaseModel):
             and self.verification_status != "verified_true"
         )
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy this assumption, dropping the cached format() output on update"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("_formatted", None)
+        return copied
+
+    def with_verification_status(self, status: VerificationStatus) -> "Assumption":
+        """Return a copy of this assumption with a new verification status"""
+        return self.model_copy(update={"verification_status": status})
+
+    # Cached format() output; safe to keep because the instance is frozen.
+    # cached_property stores it in __dict__, which == and hash() ignore.
+    @cached_property
+    def _formatted(self) -> str:
+        """Display string for format(), built on first use"""
+        return self._format()
+
     def format(self) -> str:
-        """Format this assumption for display"""
-        # Status indicator
-        status = ""
-        if self.verification_status == "verified_true":
-            status = " ✓"
-        elif self.verification_status == "verified_false":
-            status = " ✗"
-        elif self.verifiable and not self.is_verified:
-            status = " ?"
+        """Format this assumption for display (computed once per instance)"""
+        return self._formatted
+
+    def _format(self) -> str:
+        """Build the display string for format()"""
+        # Status indicator: verified markers, else "?" when it could still be verified
+        status = _STATUS_MARKERS.get(
+            self.verification_status, " ?" if self.verifiable else ""
+        )
 
         # Critical indicator
         critical_marker = " [CRITICAL]" if self.critical else ""
 
-        # Confidence display
-        confidence_str = f" (confidence: {self.confidence:.0%})"
-
         # Evidence
         evidence_str = f"\n    Evidence: {self.evidence}" if self.evidence else ""
 
-        return f"{self.id}: {self.text}{status}{critical_marker}{confidence_str}{evidence_str}"
+        return f"{self.id}: {self.text}{status}{critical_marker} (confidence: {self.confidence:.0%}){evidence_str}"
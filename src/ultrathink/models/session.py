@@ -1,32 +1,28 @@
-import sys
-from rich.console import Console
+from collections import defaultdict
+from collections.abc import Callable
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 from .thought import Thought
 from .assumption import Assumption
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-def _get_console() -> Console:
-    """Lazy-load console only when needed"""
-    return Console(file=sys.stderr)
 
-
-def _parse_assumption_id(assumption_id: str) -> tuple[str | None, str]:
+@cache
+def _get_console() -> "Console":
     """
-    Parse scoped assumption ID into (session_id, local_id)
-
-    Args:
-        assumption_id: Either "A1" (local) or "session-id:A1" (cross-session)
-
-    Returns:
-        Tuple of (session_id, local_id) where session_id is None for local refs
+    Lazy-load console only when needed (rich is imported on first use)
 
-    Examples:
-        "A1" -> (None, "A1")
-        "session-123:A1" -> ("session-123", "A1")
+    The console is built once and shared; stderr=True makes it resolve
+    sys.stderr on every write, so redirected streams are still honoured.
     """
-    if ":" in assumption_id:
-        parts = assumption_id.split(":", 1)
-        return parts[0], parts[1]
-    return None, assumption_id
+    from rich.console import Console
+
+    # Messages are pre-formatted: skip auto-highlighting, emoji-code substitution
+    # and re-wrapping the bordered thought boxes to the terminal width
+    return Console(stderr=True, highlight=False, soft_wrap=True, emoji=False)
 
 
 class ThinkingSession:
@@ -35,12 +31,36 @@ class ThinkingSession:
     Enforces business rules and maintains consistency
     """
 
+    __slots__ = (
+        "_assumptions",
+        "_branches",
+        "_cross_session_warnings",
+        "_dependent_thoughts",
+        "_falsified_ids",
+        "_log",
+        "_risky_ids",
+        "_thought_numbers",
+        "_thoughts",
+        "_unresolved_refs",
+        "_unresolved_refs_set",
+    )
+
     def __init__(self, disable_logging: bool = False):
         self._thoughts: list[Thought] = []
-        self._branches: dict[str, list[Thought]] = {}
+        self._thought_numbers: set[int] = set()  # Numbers present in _thoughts
+        self._branches: defaultdict[str, list[Thought]] = defaultdict(list)
         self._assumptions: dict[str, Assumption] = {}
-        self._disable_logging = disable_logging
+        # Derived risky/falsified ID lists, rebuilt together after assumptions change
+        self._risky_ids: list[str] | None = None
+        self._falsified_ids: list[str] | None = None
+        # Inverted index: assumption ID -> numbers of thoughts depending on it
+        self._dependent_thoughts: dict[str, list[int]] = {}
+        # Print function of the shared console, or None when logging is disabled
+        self._log: Callable[[str], None] | None = (
+            None if disable_logging else _get_console().print
+        )
         self._unresolved_refs: list[str] = []  # Track unresolved cross-session refs
+        self._unresolved_refs_set: set[str] = set()  # Membership index for the above
         self._cross_session_warnings: list[str] = []  # Track warnings
 
     @property
@@ -58,15 +78,20 @@ class ThinkingSession:
         """Get all assumptions in this session"""
         return self._assumptions.copy()
 
+    @property
+    def assumptions_view(self) -> MappingProxyType[str, Assumption]:
+        """Get a read-only live view of assumptions (no copy, for lookups)"""
+        return MappingProxyType(self._assumptions)
+
     @property
     def risky_assumptions(self) -> list[str]:
         """Get IDs of risky assumptions (critical, low confidence, unverified)"""
-        return [aid for aid, a in self._assumptions.items() if a.is_risky]
+        return self._classify_assumptions()[0].copy()
 
     @property
     def falsified_assumptions(self) -> list[str]:
         """Get IDs of assumptions proven false"""
-        return [aid for aid, a in self._assumptions.items() if a.is_falsified]
+        return self._classify_assumptions()[1].copy()
 
     @property
     def unresolved_references(self) -> list[str]:
@@ -78,6 +103,26 @@ class ThinkingSession:
         """Get warnings from cross-session operations"""
         return self._cross_session_warnings.copy()
 
+    def _classify_assumptions(self) -> tuple[list[str], list[str]]:
+        """Get (risky, falsified) assumption IDs, rebuilding both in one pass"""
+        if self._risky_ids is None or self._falsified_ids is None:
+            risky: list[str] = []
+            falsified: list[str] = []
+            for assumption_id, assumption in self._assumptions.items():
+                if assumption.is_risky:
+                    risky.append(assumption_id)
+                if assumption.is_falsified:
+                    falsified.append(assumption_id)
+            self._risky_ids = risky
+            self._falsified_ids = falsified
+        return self._risky_ids, self._falsified_ids
+
+    def _store_assumption(self, assumption: Assumption) -> None:
+        """Add or replace an assumption and drop the derived ID lists"""
+        self._assumptions[assumption.id] = assumption
+        self._risky_ids = None
+        self._falsified_ids = None
+
     def verify_assumption(self, assumption_id: str, is_true: bool) -> Assumption | None:
         """
         Mark an assumption as verified (true or false)
@@ -90,10 +135,10 @@ class ThinkingSession:
             Updated assumption if found, None if not found
         """
         if assumption_id in self._assumptions:
-            assumption = self._assumptions[assumption_id]
-            assumption.verification_status = (
+            assumption = self._assumptions[assumption_id].with_verification_status(
                 "verified_true" if is_true else "verified_false"
             )
+            self._store_assumption(assumption)
             return assumption
         return None
 
@@ -107,14 +152,7 @@ class ThinkingSession:
         Returns:
             List of thought numbers that depend on this assumption
         """
-        affected = []
-        for thought in self._thoughts:
-            if (
-                thought.depends_on_assumptions
-                and assumption_id in thought.depends_on_assumptions
-            ):
-                affected.append(thought.thought_number)
-        return affected
+        return list(self._dependent_thoughts.get(assumption_id, ()))
 
     def add_thought(
         self, thought: Thought, validated_cross_session_refs: list[str] | None = None
@@ -127,43 +165,50 @@ class ThinkingSession:
             thought: The thought to add
             validated_cross_session_refs: List of cross-session assumption IDs that have been validated by service layer
         """
-        # Auto-adjust total if needed
-        thought.auto_adjust_total()
-
         # Validate references before adding
-        existing_numbers = {t.thought_number for t in self._thoughts}
-        thought.validate_references(existing_numbers)
+        thought.validate_references(self._thought_numbers)
 
-        # Validate assumption dependencies
-        if thought.depends_on_assumptions:
-            for assumption_id in thought.depends_on_assumptions:
-                session_id, local_id = _parse_assumption_id(assumption_id)
+        # Read the assumption fields once; most thoughts have none of them,
+        # in which case each section below is skipped by a local truth test
+        depends_on = thought.depends_on_assumptions
+        new_assumptions = thought.assumptions
+        invalidates = thought.invalidates_assumptions
 
-                if session_id is None:
-                    # Local reference - strict validation (existing behavior)
-                    if assumption_id not in self._assumptions:
-                        available = sorted(self._assumptions.keys())
-                        raise ValueError(
-                            f"Cannot depend on assumption {assumption_id}: assumption not found in this session. "
-                            f"Available assumptions: {available if available else 'none'}"
+        # Validate assumption dependencies
+        if depends_on:
+            # Local references - strict validation (existing behavior), checked
+            # for the whole list with one set difference
+            missing = {d for d in depends_on if ":" not in d}.difference(
+                self._assumptions
+            )
+            if missing:
+                assumption_id = next(d for d in depends_on if d in missing)
+                available = sorted(self._assumptions.keys())
+                raise ValueError(
+                    f"Cannot depend on assumption {assumption_id}: assumption not found in this session. "
+                    f"Available assumptions: {available if available else 'none'}"
+                )
+
+            # Cross-session references - anything the service layer did not validate
+            # is unresolved (resolution failed or no validation was performed)
+            unresolved = {d for d in depends_on if ":" in d}.difference(
+                validated_cross_session_refs or ()
+            )
+            for assumption_id in depends_on:
+                if (
+                    assumption_id in unresolved
+                    and assumption_id not in self._unresolved_refs_set
+                ):
+                    self._unresolved_refs_set.add(assumption_id)
+                    self._unresolved_refs.append(assumption_id)
+                    if self._log is not None:
+                        self._log(
+                            f"[yellow]⚠️  Cross-session assumption {assumption_id} could not be resolved[/yellow]"
                         )
-                else:
-                    # Cross-session reference - check if validated by service layer
-                    if validated_cross_session_refs and assumption_id in validated_cross_session_refs:
-                        # Successfully resolved by service layer, continue normally
-                        continue
-                    else:
-                        # Not validated - either resolution failed or no validation was performed
-                        if assumption_id not in self._unresolved_refs:
-                            self._unresolved_refs.append(assumption_id)
-                            if not self._disable_logging:
-                                _get_console().print(
-                                    f"[yellow]⚠️  Cross-session assumption {assumption_id} could not be resolved[/yellow]"
-                                )
 
         # Add new assumptions from this thought
-        if thought.assumptions:
-            for assumption in thought.assumptions:
+        if new_assumptions:
+            for assumption in new_assumptions:
                 if assumption.id in self._assumptions:
                     # Validate that core fields match when updating
                     existing = self._assumptions[assumption.id]
@@ -180,48 +225,50 @@ class ThinkingSession:
                             f"Core assumption fields (text, critical) are immutable."
                         )
                     # Allow updating verification-related fields
-                    if not self._disable_logging:
-                        _get_console().print(
+                    if self._log is not None:
+                        self._log(
                             f"[yellow]⚠️  Updating assumption {assumption.id} (verification status or confidence)[/yellow]"
                         )
-                    existing.confidence = assumption.confidence
-                    existing.verifiable = assumption.verifiable
-                    existing.evidence = assumption.evidence
-                    existing.verification_status = assumption.verification_status
-                else:
-                    # Add new assumption
-                    self._assumptions[assumption.id] = assumption
+                # Add new assumption, or replace the existing one: core fields match,
+                # so the incoming instance carries the updated verification fields
+                self._store_assumption(assumption)
 
         # Handle assumption invalidations
-        if thought.invalidates_assumptions:
-            for assumption_id in thought.invalidates_assumptions:
-                session_id, local_id = _parse_assumption_id(assumption_id)
-
-                if session_id is None:
+        if invalidates:
+            for assumption_id in invalidates:
+                if ":" not in assumption_id:
                     # Local reference - existing behavior
-                    if assumption_id not in self._assumptions:
+                    current = self._assumptions.get(assumption_id)
+                    if current is None:
                         available = sorted(self._assumptions.keys())
                         raise ValueError(
                             f"Cannot invalidate assumption {assumption_id}: assumption not found in this session. "
                             f"Available assumptions: {available if available else 'none'}"
                         )
-                    self._assumptions[assumption_id].verification_status = "verified_false"
+                    self._store_assumption(
+                        current.with_verification_status("verified_false")
+                    )
                 else:
                     # Cross-session invalidation - warn and skip
                     warning = f"Cannot invalidate cross-session assumption {assumption_id}: cross-session invalidation not supported"
                     self._cross_session_warnings.append(warning)
-                    if not self._disable_logging:
-                        _get_console().print(f"[yellow]⚠️  {warning}[/yellow]")
+                    if self._log is not None:
+                        self._log(f"[yellow]⚠️  {warning}[/yellow]")
 
         # Add to history
         self._thoughts.append(thought)
+        self._thought_numbers.add(thought.thought_number)
+        if depends_on:
+            for assumption_id in dict.fromkeys(depends_on):
+                self._dependent_thoughts.setdefault(assumption_id, []).append(
+                    thought.thought_number
+                )
 
         # Track branch if applicable
         if thought.is_branch and thought.branch_id is not None:
-            if thought.branch_id not in self._branches:
-                self._branches[thought.branch_id] = []
+            # branch_id is interned when the thought is constructed
             self._branches[thought.branch_id].append(thought)
 
         # Log if enabled
-        if not self._disable_logging:
-            _get_console().print(thought.format())
+        if self._log is not None:
+            self._log(thought.format())
@@ -1,16 +1,61 @@
-from typing import Annotated, Any
-import json
-from pydantic import BaseModel, Field, field_validator
+import sys
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import Annotated, Any, Literal, Self
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    Field,
+    field_validator,
+)
+from pydantic_core import from_json
 from .assumption import Assumption
 
 
 def _validate_thought_not_empty(value: str) -> str:
     """Helper function to validate thought is non-empty"""
-    if not value or not value.strip():
+    if not value or value.isspace():
         raise ValueError("thought must be a non-empty string")
     return value
 
 
+def _intern_optional(value: str | None) -> str | None:
+    """Helper function to intern identifier strings used as dict keys"""
+    return sys.intern(value) if value else value
+
+
+def _reference_error(
+    action: str, thought_number: int, existing_thought_numbers: set[int]
+) -> ValueError:
+    """
+    Helper function to build the error for a reference to a missing thought
+
+    Args:
+        action: What the thought tried to do (e.g. "revise", "branch from")
+        thought_number: The referenced thought number
+        existing_thought_numbers: Set of thought numbers that exist in session
+
+    Returns:
+        ValueError listing the available thoughts (first and last five when long)
+    """
+    if not existing_thought_numbers:
+        # Empty session - likely forgot to pass session_id
+        return ValueError(
+            f"Cannot {action} thought {thought_number}: no thoughts exist in this session yet. "
+            f"To continue an existing session, pass the session_id parameter."
+        )
+    # Session has thoughts, but referenced one doesn't exist
+    available = [str(number) for number in sorted(existing_thought_numbers)]
+    if len(available) > 10:
+        available[5:-5] = ["..."]
+    shown = ", ".join(available)
+    return ValueError(
+        f"Cannot {action} thought {thought_number}: thought not found in this session. "
+        f"Available thoughts: [{shown}]"
+    )
+
+
 def _parse_json_list(value: Any, field_name: str) -> Any:
     """
     Helper function to parse JSON string to list, or return value as-is
@@ -36,15 +81,15 @@ def _parse_json_list(value: Any, field_name: str) -> Any:
     # Parse JSON string
     if isinstance(value, str):
         try:
-            parsed = json.loads(value)
-            if not isinstance(parsed, list):
-                raise ValueError(
-                    f"{field_name} must be a list or valid JSON string representing a list. "
-                    f"Got type: {type(parsed).__name__}"
-                )
-            return parsed
-        except json.JSONDecodeError as e:
+            parsed = from_json(value)
+        except ValueError as e:
             raise ValueError(f"{field_name} must be valid JSON. Error: {str(e)}") from e
+        if not isinstance(parsed, list):
+            raise ValueError(
+                f"{field_name} must be a list or valid JSON string representing a list. "
+                f"Got type: {type(parsed).__name__}"
+            )
+        return parsed
 
     # Unexpected type
     raise ValueError(
@@ -52,99 +97,197 @@ def _parse_json_list(value: Any, field_name: str) -> Any:
     )
 
 
+@lru_cache(maxsize=512)
+def _border_rows(border_length: int) -> tuple[str, str, str]:
+    """Helper function to build (top, separator, bottom) border rows of a width"""
+    border = "─" * border_length
+    return f"┌{border}┐", f"├{border}┤", f"└{border}┘"
+
+
+ThoughtKind = Literal["revision", "branch", "regular"]
+
+# Thought.format() pieces per kind: (prefix, color wrap, context template).
+# The color wrap is %-formatted with the finished box; the context template is
+# str.format()-ed with the thought as its only argument.
+_KIND_TABLE: dict[ThoughtKind, tuple[str, str, str]] = {
+    "revision": (
+        "🔄 Revision",
+        "[yellow]%s[/yellow]",
+        " (revising thought {0.revises_thought})",
+    ),
+    "branch": (
+        "🌿 Branch",
+        "[green]%s[/green]",
+        " (from thought {0.branch_from_thought}, ID: {0.branch_id})",
+    ),
+    "regular": ("💭 Thought", "[blue]%s[/blue]", ""),
+}
+
+# Field declarations shared by Thought, ThoughtRequest and ThoughtResponse
+_ThoughtField = Annotated[
+    str,
+    Field(min_length=1, description="Your current thinking step"),
+    AfterValidator(_validate_thought_not_empty),
+]
+_TotalThoughtsField = Annotated[
+    int,
+    Field(
+        ge=1,
+        description="Estimated total thoughts needed (numeric value, e.g., 3, 5, 10)",
+    ),
+]
+_NextThoughtNeededField = Annotated[
+    bool, Field(description="Whether another thought step is needed")
+]
+_IsRevisionField = Annotated[
+    bool | None,
+    Field(None, description="Whether this revises previous thinking"),
+]
+_RevisesThoughtField = Annotated[
+    int | None,
+    Field(None, ge=1, description="Which thought is being reconsidered"),
+]
+_BranchFromThoughtField = Annotated[
+    int | None, Field(None, ge=1, description="Branching point thought number")
+]
+_BranchIdField = Annotated[str | None, Field(None, description="Branch identifier")]
+_NeedsMoreThoughtsField = Annotated[
+    bool | None, Field(None, description="If more thoughts are needed")
+]
+_ConfidenceField = Annotated[
+    float | None,
+    Field(
+        None,
+        ge=0.0,
+        le=1.0,
+        description="Confidence level (0.0-1.0, e.g., 0.7 for 70% confident)",
+    ),
+]
+_UncertaintyNotesField = Annotated[
+    str | None,
+    Field(
+        None,
+        description="Optional explanation for uncertainty or doubts about this thought",
+    ),
+]
+_OutcomeField = Annotated[
+    str | None,
+    Field(
+        None,
+        description="What was achieved or expected as result of this thought",
+    ),
+]
+_AssumptionsField = Annotated[
+    list[Assumption] | None,
+    Field(
+        None,
+        description="Assumptions made in this thought (accepts list or JSON string via validator)",
+    ),
+]
+_DependsOnAssumptionsField = Annotated[
+    list[str] | None,
+    Field(
+        None,
+        description="Assumption IDs from previous thoughts that this thought depends on (accepts list or JSON string via validator)",
+    ),
+]
+_InvalidatesAssumptionsField = Annotated[
+    list[str] | None,
+    Field(
+        None,
+        description="Assumption IDs proven false by this thought (accepts list or JSON string via validator)",
+    ),
+]
+
+
 class Thought(BaseModel):
     """
     Model: Represents a single thought in sequential thinking process
     Encapsulates data and behaviors of a thought
     """
 
-    model_config = {"strict": True}
+    model_config = {"strict": True, "frozen": True}
 
-    thought: Annotated[
-        str, Field(min_length=1, description="Your current thinking step")
-    ]
+    thought: _ThoughtField
     thought_number: Annotated[
         int,
         Field(
             ge=1, description="Current thought number (numeric value, e.g., 1, 2, 3)"
         ),
     ]
-    total_thoughts: Annotated[
-        int,
-        Field(
-            ge=1,
-            description="Estimated total thoughts needed (numeric value, e.g., 3, 5, 10)",
-        ),
-    ]
-    next_thought_needed: Annotated[
-        bool, Field(description="Whether another thought step is needed")
-    ]
-    is_revision: Annotated[
-        bool | None,
-        Field(None, description="Whether this revises previous thinking"),
-    ] = None
-    revises_thought: Annotated[
-        int | None,
-        Field(None, ge=1, description="Which thought is being reconsidered"),
-    ] = None
-    branch_from_thought: Annotated[
-        int | None, Field(None, ge=1, description="Branching point thought number")
-    ] = None
-    branch_id: Annotated[str | None, Field(None, description="Branch identifier")] = (
-        None
-    )
-    needs_more_thoughts: Annotated[
-        bool | None, Field(None, description="If more thoughts are needed")
-    ] = None
-    confidence: Annotated[
-        float | None,
-        Field(
-            None,
-            ge=0.0,
-            le=1.0,
-            description="Confidence level (0.0-1.0, e.g., 0.7 for 70% confident)",
-        ),
-    ] = None
-    uncertainty_notes: Annotated[
-        str | None,
-        Field(
-            None,
-            description="Optional explanation for uncertainty or doubts about this thought",
-        ),
-    ] = None
-    outcome: Annotated[
-        str | None,
-        Field(
-            None,
-            description="What was achieved or expected as result of this thought",
-        ),
-    ] = None
-    assumptions: Annotated[
-        list[Assumption] | None,
-        Field(
-            None,
-            description="Assumptions made in this thought (accepts list or JSON string via validator)",
-        ),
-    ] = None
-    depends_on_assumptions: Annotated[
-        list[str] | None,
-        Field(
-            None,
-            description="Assumption IDs from previous thoughts that this thought depends on (accepts list or JSON string via validator)",
-        ),
-    ] = None
-    invalidates_assumptions: Annotated[
-        list[str] | None,
-        Field(
-            None,
-            description="Assumption IDs proven false by this thought (accepts list or JSON string via validator)",
-        ),
-    ] = None
+    total_thoughts: _TotalThoughtsField
+    next_thought_needed: _NextThoughtNeededField
+    is_revision: _IsRevisionField = None
+    revises_thought: _RevisesThoughtField = None
+    branch_from_thought: _BranchFromThoughtField = None
+    branch_id: _BranchIdField = None
+    needs_more_thoughts: _NeedsMoreThoughtsField = None
+    confidence: _ConfidenceField = None
+    uncertainty_notes: _UncertaintyNotesField = None
+    outcome: _OutcomeField = None
+    assumptions: _AssumptionsField = None
+    depends_on_assumptions: _DependsOnAssumptionsField = None
+    invalidates_assumptions: _InvalidatesAssumptionsField = None
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Auto-adjust total thoughts and intern the branch ID after construction"""
+        # Frozen, so adjusted values are written past pydantic's __setattr__
+        if self.thought_number > self.total_thoughts:
+            object.__setattr__(self, "total_thoughts", self.thought_number)
+        if self.branch_id:
+            # Keys the session's branch index; repeats across many thoughts
+            object.__setattr__(self, "branch_id", sys.intern(self.branch_id))
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy this thought, recomputing cached and adjusted values on update"""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # model_copy() carries __dict__ over and skips model_post_init()
+            for cached in ("is_branch", "is_final", "_formatted"):
+                copied.__dict__.pop(cached, None)
+            copied.model_post_init(None)
+        return copied
 
-    @field_validator("thought")
     @classmethod
-    def validate_thought_not_empty(cls, v: str) -> str:
-        return _validate_thought_not_empty(v)
+    def from_request(
+        cls,
+        request: "ThoughtRequest",
+        thought_number: int,
+        next_thought_needed: bool,
+    ) -> "Thought":
+        """
+        Build a thought from a validated request
+
+        Every field was validated on the request, so the thought is constructed
+        without a dump/validate round-trip.
+
+        Args:
+            request: Validated ThoughtRequest (its session_id is not copied)
+            thought_number: Thought number, explicit or auto-assigned
+            next_thought_needed: Whether another thought follows, explicit or auto-assigned
+
+        Returns:
+            Thought carrying the request's content
+        """
+        return cls.model_construct(
+            thought=request.thought,
+            thought_number=thought_number,
+            total_thoughts=request.total_thoughts,
+            next_thought_needed=next_thought_needed,
+            is_revision=request.is_revision,
+            revises_thought=request.revises_thought,
+            branch_from_thought=request.branch_from_thought,
+            branch_id=request.branch_id,
+            needs_more_thoughts=request.needs_more_thoughts,
+            confidence=request.confidence,
+            uncertainty_notes=request.uncertainty_notes,
+            outcome=request.outcome,
+            assumptions=request.assumptions,
+            depends_on_assumptions=request.depends_on_assumptions,
+            invalidates_assumptions=request.invalidates_assumptions,
+        )
 
     @field_validator("assumptions", mode="before")
     @classmethod
@@ -164,21 +307,18 @@ class Thought(BaseModel):
         """Parse invalidates_assumptions from JSON string or list"""
         return _parse_json_list(v, "invalidates_assumptions")
 
-    @property
+    # Computed on first access; the instance is frozen
+    @cached_property
     def is_branch(self) -> bool:
         """Check if this thought is a branch"""
-        return bool(self.branch_from_thought and self.branch_id)
+        # An empty branch_id names no branch (validate_references skips it too)
+        return self.branch_from_thought is not None and bool(self.branch_id)
 
-    @property
+    @cached_property
     def is_final(self) -> bool:
         """Check if this is the final thought"""
         return not self.next_thought_needed
 
-    def auto_adjust_total(self) -> None:
-        """Auto-adjust total thoughts if current number exceeds it"""
-        if self.thought_number > self.total_thoughts:
-            self.total_thoughts = self.thought_number
-
     def validate_references(self, existing_thought_numbers: set[int]) -> None:
         """
         Validate that referenced thoughts exist in history
@@ -189,67 +329,43 @@ class Thought(BaseModel):
         Raises:
             ValueError: If referenced thought does not exist
         """
+        references: list[tuple[str, int]] = []
         if self.is_revision and self.revises_thought is not None:
-            if self.revises_thought not in existing_thought_numbers:
-                # Build helpful error message
-                if not existing_thought_numbers:
-                    # Empty session - likely forgot to pass session_id
-                    raise ValueError(
-                        f"Cannot revise thought {self.revises_thought}: no thoughts exist in this session yet. "
-                        f"To continue an existing session, pass the session_id parameter."
-                    )
-                else:
-                    # Session has thoughts, but referenced one doesn't exist
-                    available = sorted(existing_thought_numbers)
-                    raise ValueError(
-                        f"Cannot revise thought {self.revises_thought}: thought not found in this session. "
-                        f"Available thoughts: {available}"
-                    )
-
-        if self.is_branch and self.branch_from_thought is not None:
-            if self.branch_from_thought not in existing_thought_numbers:
-                # Build helpful error message
-                if not existing_thought_numbers:
-                    # Empty session - likely forgot to pass session_id
-                    raise ValueError(
-                        f"Cannot branch from thought {self.branch_from_thought}: no thoughts exist in this session yet. "
-                        f"To continue an existing session, pass the session_id parameter."
-                    )
-                else:
-                    # Session has thoughts, but referenced one doesn't exist
-                    available = sorted(existing_thought_numbers)
-                    raise ValueError(
-                        f"Cannot branch from thought {self.branch_from_thought}: thought not found in this session. "
-                        f"Available thoughts: {available}"
-                    )
+            references.append(("revise", self.revises_thought))
+        if self.branch_id and self.branch_from_thought is not None:
+            references.append(("branch from", self.branch_from_thought))
 
-    def format(self) -> str:
-        """Format this thought for display with colors and borders"""
-        prefix = ""
-        context = ""
+        for action, thought_number in references:
+            if thought_number not in existing_thought_numbers:
+                raise _reference_error(action, thought_number, existing_thought_numbers)
 
+    def _kind(self) -> ThoughtKind:
+        """Classify this thought for display (revision takes precedence)"""
         if self.is_revision:
-            prefix = "🔄 Revision"
-            context = f" (revising thought {self.revises_thought})"
-            color = "yellow"
-        elif self.is_branch:
-            prefix = "🌿 Branch"
-            context = (
-                f" (from thought {self.branch_from_thought}, ID: {self.branch_id})"
-            )
-            color = "green"
-        else:
-            prefix = "💭 Thought"
-            context = ""
-            color = "blue"
+            return "revision"
+        return "branch" if self.is_branch else "regular"
+
+    # Cached format() output; safe to keep because the instance is frozen.
+    # cached_property stores it in __dict__, which == and hash() ignore.
+    @cached_property
+    def _formatted(self) -> str:
+        """Display string for format(), built on first use"""
+        return self._format()
+
+    def format(self) -> str:
+        """Format this thought for display with colors and borders (cached)"""
+        return self._formatted
 
+    def _format(self) -> str:
+        """Build the display string for format()"""
         # Add confidence display if present
         confidence_str = (
             f" [Confidence: {self.confidence:.0%}]"
             if self.confidence is not None
             else ""
         )
-        header = f"{prefix} {self.thought_number}/{self.total_thoughts}{context}{confidence_str}"
+        prefix, color_wrap, context = _KIND_TABLE[self._kind()]
+        header = f"{prefix} {self.thought_number}/{self.total_thoughts}{context.format(self)}{confidence_str}"
 
         # Build content lines to calculate max width
         content_lines = []
@@ -272,77 +388,72 @@ class Thought(BaseModel):
         # Assumptions (if present)
         assumption_lines = []
         if self.assumptions:
-            for assumption in self.assumptions:
-                assumption_lines.append(f"    {assumption.format()}")
-                content_lines.extend(assumption_lines)
+            assumption_lines = [
+                f"    {assumption.format()}" for assumption in self.assumptions
+            ]
+            content_lines.extend(assumption_lines)
 
         # Dependencies (if present)
+        dep_line = None
         if self.depends_on_assumptions:
             dep_line = f"📎 Depends on: {', '.join(self.depends_on_assumptions)}"
             content_lines.append(dep_line)
 
         # Invalidations (if present)
+        inv_line = None
         if self.invalidates_assumptions:
             inv_line = f"❌ Invalidates: {', '.join(self.invalidates_assumptions)}"
             content_lines.append(inv_line)
 
         # Calculate border length from longest line
-        all_lines = [header] + content_lines
-        border_length = max(len(line) for line in all_lines) + 4
-        border = "─" * border_length
+        border_length = max(map(len, chain((header,), content_lines))) + 4
+        top, separator, bottom = _border_rows(border_length)
+        # Metadata lines are padded to border_length - 2, main content to - 1
+        width = border_length - 2
 
         # Build final formatted output
-        lines = [f"┌{border}┐"]
+        lines = [top]
 
-        # Header (uses -2 padding for metadata lines)
-        lines.append(f"│ {header}{' ' * (border_length - len(header) - 2)}│")
+        # Header
+        lines.append(f"│ {header.ljust(width)}│")
 
-        # Uncertainty notes (if present, uses -2 padding for metadata lines)
+        # Uncertainty notes (if present)
         if uncertainty_line:
-            lines.append(
-                f"│ {uncertainty_line}{' ' * (border_length - len(uncertainty_line) - 2)}│"
-            )
+            lines.append(f"│ {uncertainty_line.ljust(width)}│")
 
         # Separator
-        lines.append(f"├{border}┤")
+        lines.append(separator)
 
         # Main thought content (intentionally uses -1 padding for main content, different from -2 for metadata)
-        lines.append(
-            f"│ {self.thought}{' ' * (border_length - len(self.thought) - 1)}│"
-        )
+        lines.append(f"│ {self.thought.ljust(width + 1)}│")
 
-        # Outcome (if present, uses -2 padding for metadata lines)
+        # Outcome (if present)
         if outcome_line:
-            lines.append(
-                f"│ {outcome_line}{' ' * (border_length - len(outcome_line) - 2)}│"
-            )
+            lines.append(f"│ {outcome_line.ljust(width)}│")
 
         # Assumptions (if present)
         if assumption_lines:
-            lines.append(f"├{border}┤")
-            lines.append(
-                f"│ 📋 Assumptions:{' ' * (border_length - len('📋 Assumptions:') - 2)}│"
-            )
+            lines.append(separator)
+            lines.append(f"│ {'📋 Assumptions:'.ljust(width)}│")
             for assumption_line in assumption_lines:
-                lines.append(
-                    f"│ {assumption_line}{' ' * (border_length - len(assumption_line) - 2)}│"
-                )
+                lines.append(f"│ {assumption_line.ljust(width)}│")
 
-        # Dependencies (if present, uses -2 padding for metadata lines)
-        if self.depends_on_assumptions:
-            dep_line = f"📎 Depends on: {', '.join(self.depends_on_assumptions)}"
-            lines.append(f"│ {dep_line}{' ' * (border_length - len(dep_line) - 2)}│")
+        # Dependencies (if present)
+        if dep_line:
+            lines.append(f"│ {dep_line.ljust(width)}│")
 
-        # Invalidations (if present, uses -2 padding for metadata lines)
-        if self.invalidates_assumptions:
-            inv_line = f"❌ Invalidates: {', '.join(self.invalidates_assumptions)}"
-            lines.append(f"│ {inv_line}{' ' * (border_length - len(inv_line) - 2)}│")
+        # Invalidations (if present)
+        if inv_line:
+            lines.append(f"│ {inv_line.ljust(width)}│")
 
         # Bottom border
-        lines.append(f"└{border}┘")
+        lines.append(bottom)
+
+        return color_wrap % "\n".join(lines)
+
 
-        formatted = "\n".join(lines)
-        return f"[{color}]{formatted}[/{color}]"
+# List fields that MCP clients may also send as JSON strings
+_JSON_LIST_FIELDS = ("assumptions", "depends_on_assumptions", "invalidates_assumptions")
 
 
 class ThoughtRequest(BaseModel):
@@ -351,18 +462,10 @@ class ThoughtRequest(BaseModel):
     Represents input from MCP clients
     """
 
-    model_config = {"strict": True}
+    model_config = {"strict": True, "frozen": True}
 
-    thought: Annotated[
-        str, Field(min_length=1, description="Your current thinking step")
-    ]
-    total_thoughts: Annotated[
-        int,
-        Field(
-            ge=1,
-            description="Estimated total thoughts needed (numeric value, e.g., 3, 5, 10)",
-        ),
-    ]
+    thought: _ThoughtField
+    total_thoughts: _TotalThoughtsField
     next_thought_needed: Annotated[
         bool | None,
         Field(
@@ -382,70 +485,44 @@ class ThoughtRequest(BaseModel):
         str | None,
         Field(None, description="Session identifier (None = create new session)"),
     ] = None
-    is_revision: Annotated[
-        bool | None, Field(None, description="Whether this revises previous thinking")
-    ] = None
-    revises_thought: Annotated[
-        int | None, Field(None, ge=1, description="Which thought is being reconsidered")
-    ] = None
-    branch_from_thought: Annotated[
-        int | None, Field(None, ge=1, description="Branching point thought number")
-    ] = None
-    branch_id: Annotated[str | None, Field(None, description="Branch identifier")] = (
-        None
-    )
-    needs_more_thoughts: Annotated[
-        bool | None, Field(None, description="If more thoughts are needed")
-    ] = None
-    confidence: Annotated[
-        float | None,
-        Field(
-            None,
-            ge=0.0,
-            le=1.0,
-            description="Confidence level (0.0-1.0, e.g., 0.7 for 70% confident)",
-        ),
-    ] = None
-    uncertainty_notes: Annotated[
-        str | None,
-        Field(
-            None,
-            description="Optional explanation for uncertainty or doubts about this thought",
-        ),
-    ] = None
-    outcome: Annotated[
-        str | None,
-        Field(
-            None,
-            description="What was achieved or expected as result of this thought",
-        ),
-    ] = None
-    assumptions: Annotated[
-        list[Assumption] | None,
-        Field(
-            None,
-            description="Assumptions made in this thought (accepts list or JSON string via validator)",
-        ),
-    ] = None
-    depends_on_assumptions: Annotated[
-        list[str] | None,
-        Field(
-            None,
-            description="Assumption IDs from previous thoughts that this thought depends on (accepts list or JSON string via validator)",
-        ),
-    ] = None
-    invalidates_assumptions: Annotated[
-        list[str] | None,
-        Field(
-            None,
-            description="Assumption IDs proven false by this thought (accepts list or JSON string via validator)",
-        ),
-    ] = None
+    is_revision: _IsRevisionField = None
+    revises_thought: _RevisesThoughtField = None
+    branch_from_thought: _BranchFromThoughtField = None
+    branch_id: _BranchIdField = None
+    needs_more_thoughts: _NeedsMoreThoughtsField = None
+    confidence: _ConfidenceField = None
+    uncertainty_notes: _UncertaintyNotesField = None
+    outcome: _OutcomeField = None
+    assumptions: _AssumptionsField = None
+    depends_on_assumptions: _DependsOnAssumptionsField = None
+    invalidates_assumptions: _InvalidatesAssumptionsField = None
 
-    @field_validator("thought")
     @classmethod
-    def validate_thought_not_empty(cls, v: str) -> str:
-        return _validate_thought_not_empty(v)
+    def from_tool_arguments(cls, **arguments: Any) -> "ThoughtRequest":
+        """
+        Build a request from tool arguments already validated by FastMCP
+
+        The tool signature carries the same field constraints, so validation is
+        skipped unless a list field arrived as a JSON string and still needs
+        parsing by the field validators.
+
+        Args:
+            **arguments: Tool arguments keyed by field name
+
+        Returns:
+            ThoughtRequest built from the arguments
+        """
+        if any(isinstance(arguments.get(name), str) for name in _JSON_LIST_FIELDS):
+            return cls(**arguments)
+        for name in ("session_id", "branch_id"):
+            arguments[name] = _intern_optional(arguments.get(name))
+        return cls.model_construct(**arguments)
+
+    @field_validator("session_id", "branch_id")
+    @classmethod
+    def intern_identifiers(cls, v: str | None) -> str | None:
+        """Intern session/branch IDs so repeated dict lookups compare by identity"""
+        return _intern_optional(v)
 
     @field_validator("assumptions", mode="before")
     @classmethod
@@ -472,7 +549,7 @@ class ThoughtResponse(BaseModel):
     Represents output sent to MCP clients
     """
 
-    model_config = {"strict": True}
+    model_config = {"strict": True, "frozen": True}
 
     session_id: Annotated[str, Field(description="Session identifier for continuation")]
     thought_number: Annotated[
@@ -481,9 +558,7 @@ class ThoughtResponse(BaseModel):
     total_thoughts: Annotated[
         int, Field(ge=1, description="Total number of thoughts planned")
     ]
-    next_thought_needed: Annotated[
-        bool, Field(description="Whether another thought step is needed")
-    ]
+    next_thought_needed: _NextThoughtNeededField
     branches: Annotated[
         list[str], Field(description="List of active branch identifiers")
     ]
@@ -499,20 +574,8 @@ class ThoughtResponse(BaseModel):
             description="Confidence level of this thought (0.0-1.0)",
         ),
     ] = None
-    uncertainty_notes: Annotated[
-        str | None,
-        Field(
-            None,
-            description="Optional explanation for uncertainty or doubts about this thought",
-        ),
-    ] = None
-    outcome: Annotated[
-        str | None,
-        Field(
-            None,
-            description="What was achieved or expected as result of this thought",
-        ),
-    ] = None
+    uncertainty_notes: _UncertaintyNotesField = None
+    outcome: _OutcomeField = None
     all_assumptions: Annotated[
         dict[str, Assumption],
         Field(
@@ -1,7 +1,82 @@
 import os
+import sys
 import uuid
-from ..models.thought import Thought, ThoughtRequest, ThoughtResponse
-from ..models.session import ThinkingSession, _parse_assumption_id
+import warnings
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+from pydantic import TypeAdapter
+from ..models.thought import (
+    Thought,
+    ThoughtRequest,
+    ThoughtResponse,
+    _validate_thought_not_empty,
+)
+from ..models.session import ThinkingSession
+
+
+_DEFAULT_MAX_SESSIONS = 1024
+
+
+def _read_max_sessions() -> int:
+    """
+    Read the session limit from ULTRATHINK_MAX_SESSIONS
+
+    A bad value must not stop the server, so it is replaced with a warning:
+    a non-integer falls back to the default and anything below 1 becomes 1.
+
+    Returns:
+        Number of sessions to keep (default 1024 when unset or empty)
+    """
+    value = os.environ.get("ULTRATHINK_MAX_SESSIONS", "").strip()
+    if not value:
+        return _DEFAULT_MAX_SESSIONS
+    try:
+        max_sessions = int(value)
+    except ValueError:
+        warnings.warn(
+            f"ULTRATHINK_MAX_SESSIONS must be an integer, got {value!r}; "
+            f"using {_DEFAULT_MAX_SESSIONS}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return _DEFAULT_MAX_SESSIONS
+    if max_sessions < 1:
+        warnings.warn(
+            f"ULTRATHINK_MAX_SESSIONS must be at least 1, got {max_sessions}; using 1",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return 1
+    return max_sessions
+
+
+# Read once at import; the service is created once per server process
+_DISABLE_LOGGING = os.environ.get("DISABLE_THOUGHT_LOGGING", "").lower() == "true"
+_MAX_SESSIONS = _read_max_sessions()
+
+# Validates a whole batch in one call; ThoughtRequest instances pass through as-is
+_REQUEST_LIST_ADAPTER = TypeAdapter(list[ThoughtRequest])
+
+
+def _parse_assumption_id(assumption_id: str) -> tuple[str | None, str]:
+    """
+    Parse scoped assumption ID into (session_id, local_id)
+
+    Args:
+        assumption_id: Either "A1" (local) or "session-id:A1" (cross-session)
+
+    Returns:
+        Tuple of (session_id, local_id) where session_id is None for local refs
+
+    Examples:
+        "A1" -> (None, "A1")
+        "session-123:A1" -> ("session-123", "A1")
+    """
+    session_id, separator, local_id = assumption_id.partition(":")
+    if separator:
+        return session_id, local_id
+    return None, assumption_id
 
 
 class UltraThinkService:
@@ -10,11 +85,35 @@ class UltraThinkService:
     Handles session lifecycle and coordinates between models and interface
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("_disable_logging", "_max_sessions", "_sessions")
+
+    def __init__(
+        self, disable_logging: bool | None = None, max_sessions: int | None = None
+    ) -> None:
+        """
+        Args:
+            disable_logging: Suppress thought logging to stderr; defaults to the
+                DISABLE_THOUGHT_LOGGING environment variable read at import
+            max_sessions: Number of sessions kept before the least recently used
+                one is dropped; defaults to ULTRATHINK_MAX_SESSIONS (1024)
+
+        Raises:
+            ValueError: If max_sessions is below 1
+        """
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError(f"max_sessions must be at least 1, got {max_sessions}")
         self._disable_logging = (
-            os.environ.get("DISABLE_THOUGHT_LOGGING", "").lower() == "true"
+            _DISABLE_LOGGING if disable_logging is None else disable_logging
         )
-        self._sessions: dict[str, ThinkingSession] = {}
+        self._max_sessions = _MAX_SESSIONS if max_sessions is None else max_sessions
+        # Ordered from least to most recently used
+        self._sessions: OrderedDict[str, ThinkingSession] = OrderedDict()
+
+    def _register_session(self, session_id: str, session: ThinkingSession) -> None:
+        """Register a new session, evicting the least recently used one when full"""
+        self._sessions[session_id] = session
+        if len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
 
     def _resolve_cross_session_assumption(
         self, scoped_id: str, current_session_id: str
@@ -26,6 +125,9 @@ class UltraThinkService:
             scoped_id: Scoped assumption ID (e.g., "session-1:A1")
             current_session_id: Current session ID
 
+        A resolved reference counts as a use of the target session, so it is
+        moved to the most recently used end of the registry.
+
         Returns:
             Tuple of (resolved_local_id, was_resolved)
             - If resolved: ("A1", True) - assumption exists in target session
@@ -42,15 +144,12 @@ class UltraThinkService:
             # Not a cross-session reference
             return scoped_id, True
 
-        # Check if target session exists
-        if target_session_id not in self._sessions:
-            return None, False
-
-        # Check if assumption exists in target session
-        target_session = self._sessions[target_session_id]
-        if local_id not in target_session.all_assumptions:
+        # Check that the target session exists and holds the assumption
+        target_session = self._sessions.get(target_session_id)
+        if target_session is None or local_id not in target_session.assumptions_view:
             return None, False
 
+        self._sessions.move_to_end(target_session_id)
         return local_id, True
 
     def process_thought(self, request: ThoughtRequest) -> ThoughtResponse:
@@ -67,22 +166,30 @@ class UltraThinkService:
             ValidationError: If request validation fails
             ValueError: If domain validation fails
         """
-        # Get or create session (resilient pattern)
+        # Requests built from tool arguments skip model validators, so repeat the
+        # one check the tool signature cannot express
+        _validate_thought_not_empty(request.thought)
+
+        # Get or create session (resilient pattern); a new session is registered
+        # only once its first thought is accepted, so a rejected request cannot
+        # evict a live session
         if request.session_id is None:
-            # Generate new session ID
-            session_id = str(uuid.uuid4())
-            self._sessions[session_id] = ThinkingSession(
-                disable_logging=self._disable_logging
-            )
+            # Generate new session ID (interned: it is the registry key and is
+            # echoed back by clients, whose request IDs are interned on validation)
+            session_id = sys.intern(str(uuid.uuid4()))
+            existing = None
         else:
             # Use existing session or create new with provided ID
             session_id = request.session_id
-            if session_id not in self._sessions:
-                self._sessions[session_id] = ThinkingSession(
-                    disable_logging=self._disable_logging
-                )
-
-        session = self._sessions[session_id]
+            existing = self._sessions.get(session_id)
+            if existing is None:
+                session_id = sys.intern(session_id)
+            else:
+                self._sessions.move_to_end(session_id)
+        if existing is None:
+            session = ThinkingSession(disable_logging=self._disable_logging)
+        else:
+            session = existing
 
         # Auto-assign thought_number if not provided
         if request.thought_number is None:
@@ -108,20 +215,20 @@ class UltraThinkService:
                         validated_cross_session_refs.append(assumption_id)
 
         # Translate request to thought model (exclude session_id, override auto-assigned fields)
-        thought_data = request.model_dump(exclude={"session_id"})
-        thought_data["thought_number"] = thought_number
-        thought_data["next_thought_needed"] = next_thought_needed
-        thought = Thought(**thought_data)
+        thought = Thought.from_request(request, thought_number, next_thought_needed)
 
         # Execute business logic
         session.add_thought(thought, validated_cross_session_refs)
+        if existing is None:
+            self._register_session(session_id, session)
 
         # Collect unresolved references and warnings from session
         unresolved = session.unresolved_references
-        warnings = session.cross_session_warnings
+        cross_warnings = session.cross_session_warnings
 
-        # Return response
-        return ThoughtResponse(
+        # Return response (every value comes from validated requests and session
+        # state, so the response is constructed without validating it again)
+        return ThoughtResponse.model_construct(
             session_id=session_id,
             thought_number=thought.thought_number,
             total_thoughts=thought.total_thoughts,
@@ -135,5 +242,35 @@ class UltraThinkService:
             risky_assumptions=session.risky_assumptions,
             falsified_assumptions=session.falsified_assumptions,
             unresolved_references=unresolved,
-            cross_session_warnings=warnings,
+            cross_session_warnings=cross_warnings,
         )
+
+    def process_thoughts(
+        self, requests: Sequence[ThoughtRequest | dict[str, Any]]
+    ) -> list[ThoughtResponse]:
+        """
+        Process several thought requests in order
+
+        A request without session_id continues the session of the previous
+        request in the batch (the first one creates a new session as usual).
+        Raw dicts are validated together before any thought is processed.
+
+        Args:
+            requests: ThoughtRequests from interface layer, or their raw fields
+
+        Returns:
+            One ThoughtResponse per request, in the same order
+
+        Raises:
+            ValidationError: If a raw request fails validation; nothing is recorded
+            ValueError: If domain validation fails; earlier thoughts stay recorded
+        """
+        responses: list[ThoughtResponse] = []
+        session_id: str | None = None
+        for request in _REQUEST_LIST_ADAPTER.validate_python(list(requests)):
+            if request.session_id is None and session_id is not None:
+                request = request.model_copy(update={"session_id": session_id})
+            response = self.process_thought(request)
+            session_id = response.session_id
+            responses.append(response)
+        return responses
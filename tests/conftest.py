@@ -0,0 +1,36 @@
+"""Shared pytest fixtures"""
+
+import uuid
+from collections.abc import Callable
+from functools import partial
+
+import pytest
+
+from ultrathink.models.thought import ThoughtRequest
+from ultrathink.services.thinking_service import UltraThinkService
+
+
+@pytest.fixture(scope="session")
+def service() -> UltraThinkService:
+    """Create one service instance with logging disabled, shared by all tests"""
+    return UltraThinkService(disable_logging=True)
+
+
+@pytest.fixture(scope="session")
+def server_with_logging() -> UltraThinkService:
+    """Create one server instance with logging enabled, shared by all tests"""
+    return UltraThinkService(disable_logging=False)
+
+
+@pytest.fixture
+def session_id() -> str:
+    """Create a session ID unique to the test, isolating it in a shared service"""
+    return f"test-{uuid.uuid4().hex}"
+
+
+@pytest.fixture(scope="session")
+def thought_request() -> Callable[..., ThoughtRequest]:
+    """Create a ThoughtRequest factory for a first, non-final thought of three"""
+    return partial(
+        ThoughtRequest, total_thoughts=3, thought_number=1, next_thought_needed=True
+    )
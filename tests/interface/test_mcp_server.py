@@ -1,17 +1,25 @@
 """Tests for MCP server tool function"""
 
-import os
-from ultrathink.interface.mcp_server import ultrathink
+import pytest
+
+from ultrathink.interface import mcp_server
+from ultrathink.interface.mcp_server import ultrathink, ultrathink_batch
 from ultrathink.models.thought import ThoughtRequest
+from ultrathink.services.thinking_service import UltraThinkService
 
 
 class TestUltraThinkTool:
     """Test suite for ultrathink tool function"""
 
+    @pytest.fixture(autouse=True)
+    def quiet_service(
+        self, monkeypatch: pytest.MonkeyPatch, service: UltraThinkService
+    ) -> None:
+        """Route tool calls to the shared service with logging disabled"""
+        monkeypatch.setattr(mcp_server, "thinking_service", service)
+
     def test_ultrathink_tool_via_fn_attribute(self) -> None:
         """Should return ThoughtResponse when calling ultrathink.fn()"""
-        os.environ["DISABLE_THOUGHT_LOGGING"] = "true"
-
         # Test with flat parameters (unpack from ThoughtRequest)
         request = ThoughtRequest(
             thought="Test thought",
@@ -28,8 +36,6 @@ class TestUltraThinkTool:
 
     def test_ultrathink_tool_with_auto_assigned_next_thought(self) -> None:
         """Should auto-assign next_thought_needed when omitted"""
-        os.environ["DISABLE_THOUGHT_LOGGING"] = "true"
-
         # Test without next_thought_needed - should auto-assign
         request = ThoughtRequest(
             thought="Test thought",
@@ -42,3 +48,29 @@ class TestUltraThinkTool:
         assert response.thought_number == 1
         assert response.total_thoughts == 3
         assert response.next_thought_needed is True  # Auto-assigned
+
+    def test_ultrathink_tool_accepts_json_string_lists(self) -> None:
+        """Should parse list parameters sent as JSON strings"""
+        request = ThoughtRequest(thought="Test thought", total_thoughts=2)
+        arguments = request.model_dump()
+        arguments["assumptions"] = '[{"id": "A1", "text": "Input is sorted"}]'
+
+        response = ultrathink.fn(**arguments)
+        assert list(response.all_assumptions) == ["A1"]
+
+    def test_ultrathink_tool_rejects_whitespace_thought(self) -> None:
+        """Should reject a whitespace-only thought passed as a tool argument"""
+        with pytest.raises(ValueError, match="thought must be a non-empty string"):
+            ultrathink.fn(thought="   ", total_thoughts=1)
+
+    def test_ultrathink_batch_tool_via_fn_attribute(self) -> None:
+        """Should return one ThoughtResponse per thought in the batch"""
+        responses = ultrathink_batch.fn(
+            [
+                ThoughtRequest(thought="Step 1", total_thoughts=2),
+                ThoughtRequest(thought="Step 2", total_thoughts=2),
+            ]
+        )
+        assert [r.thought_number for r in responses] == [1, 2]
+        assert responses[0].session_id == responses[1].session_id
+        assert responses[1].next_thought_needed is False
@@ -274,3 +274,48 @@ class TestAssumptionModel:
         # Missing number after A
         with pytest.raises(ValidationError):
             Assumption(id="session:A", text="Test")
+
+    def test_assumption_is_immutable(self) -> None:
+        """Should reject attribute assignment after construction"""
+        assumption = Assumption(id="A1", text="Test")
+        with pytest.raises(ValidationError):
+            assumption.verification_status = "verified_true"
+
+    def test_with_verification_status_returns_copy(self) -> None:
+        """Should return an updated copy and leave the original untouched"""
+        assumption = Assumption(id="A1", text="Test", evidence="Docs")
+        updated = assumption.with_verification_status("verified_false")
+
+        assert updated is not assumption
+        assert updated.verification_status == "verified_false"
+        assert updated.evidence == "Docs"
+        assert assumption.verification_status is None
+
+    def test_format_is_cached_per_instance(self) -> None:
+        """Should reuse the formatted string and rebuild it for updated copies"""
+        assumption = Assumption(id="A1", text="Test", verifiable=True)
+        formatted = assumption.format()
+        assert assumption.format() is formatted
+        assert "A1: Test ?" in formatted
+
+        updated = assumption.with_verification_status("verified_true")
+        assert "A1: Test ✓" in updated.format()
+
+    def test_formatted_assumption_equals_unformatted(self) -> None:
+        """Should compare and hash equal whether or not format() has run"""
+        formatted = Assumption(id="A1", text="Test")
+        formatted.format()
+        unformatted = Assumption(id="A1", text="Test")
+
+        assert formatted == unformatted
+        assert formatted == formatted.model_copy()
+        assert len({formatted, unformatted}) == 1
+
+    def test_model_copy_update_rebuilds_format(self) -> None:
+        """Should not carry the cached format() output into an updated copy"""
+        assumption = Assumption(id="A1", text="Test", confidence=0.5)
+        assert "(confidence: 50%)" in assumption.format()
+
+        updated = assumption.model_copy(update={"confidence": 0.9})
+        assert "(confidence: 90%)" in updated.format()
+        assert assumption.model_copy().format() is assumption.format()
@@ -1,5 +1,6 @@
-import os
-from typing import Generator
+import subprocess
+import sys
+from collections.abc import Callable
 import pytest
 from ultrathink.services.thinking_service import UltraThinkService
 from ultrathink.models.thought import ThoughtRequest, ThoughtResponse
@@ -9,50 +10,72 @@ from ultrathink.models.assumption import Assumption
 class TestLogging:
     """Test suite for logging and formatting functionality"""
 
-    @pytest.fixture
-    def server_with_logging(self) -> Generator[UltraThinkService, None, None]:
-        """Create a server instance with logging enabled"""
-        if "DISABLE_THOUGHT_LOGGING" in os.environ:
-            del os.environ["DISABLE_THOUGHT_LOGGING"]
-        server = UltraThinkService()
-        os.environ["DISABLE_THOUGHT_LOGGING"] = "true"
-        yield server
+    def test_rich_not_imported_until_logging(self) -> None:
+        """Should not import rich when thoughts are never logged"""
+        code = (
+            "import sys\n"
+            "from ultrathink.models.session import ThinkingSession\n"
+            "ThinkingSession(disable_logging=True)\n"
+            "assert 'rich' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_console_is_shared_and_follows_stderr(
+        self,
+        server_with_logging: UltraThinkService,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Should reuse one console that writes to the current stderr"""
+        from ultrathink.models.session import _get_console
+
+        assert _get_console() is _get_console()
+
+        server_with_logging.process_thought(
+            ThoughtRequest(thought="Logged to stderr", total_thoughts=1)
+        )
+        assert "Logged to stderr" in capsys.readouterr().err
+
+    def test_console_keeps_long_lines_and_emoji_codes(
+        self,
+        server_with_logging: UltraThinkService,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Should log thoughts verbatim, without wrapping or emoji codes"""
+        thought = "Check :thumbs_up: handling " + "x" * 300
+        server_with_logging.process_thought(
+            ThoughtRequest(thought=thought, total_thoughts=1)
+        )
+        assert thought in capsys.readouterr().err
 
     def test_format_and_log_regular_thoughts(
-        self, server_with_logging: UltraThinkService
+        self,
+        server_with_logging: UltraThinkService,
+        thought_request: Callable[..., ThoughtRequest],
     ) -> None:
         """Should format and log regular thoughts"""
-        request = ThoughtRequest(
-            thought="Test thought with logging",
-            thought_number=1,
-            total_thoughts=3,
-            next_thought_needed=True,
-        )
+        request = thought_request(thought="Test thought with logging")
 
         response = server_with_logging.process_thought(request)
         assert isinstance(response, ThoughtResponse)
 
     def test_format_and_log_revision_thoughts(
-        self, server_with_logging: UltraThinkService
+        self,
+        server_with_logging: UltraThinkService,
+        thought_request: Callable[..., ThoughtRequest],
+        session_id: str,
     ) -> None:
         """Should format and log revision thoughts"""
-        session_id = "test-session"
         # Create original thought first
-        request1 = ThoughtRequest(
+        request1 = thought_request(
             thought="Original thought",
-            thought_number=1,
-            total_thoughts=3,
-            next_thought_needed=True,
             session_id=session_id,
         )
         server_with_logging.process_thought(request1)
 
         # Now revise it
-        request2 = ThoughtRequest(
+        request2 = thought_request(
             thought="Revised thought",
             thought_number=2,
-            total_thoughts=3,
-            next_thought_needed=True,
             is_revision=True,
             revises_thought=1,
             session_id=session_id,
@@ -62,25 +85,23 @@ class TestLogging:
         assert isinstance(response, ThoughtResponse)
 
     def test_format_and_log_branch_thoughts(
-        self, server_with_logging: UltraThinkService
+        self,
+        server_with_logging: UltraThinkService,
+        thought_request: Callable[..., ThoughtRequest],
+        session_id: str,
     ) -> None:
         """Should format and log branch thoughts"""
-        session_id = "test-session"
         # Create original thought first
-        request1 = ThoughtRequest(
+        request1 = thought_request(
             thought="Original thought",
-            thought_number=1,
-            total_thoughts=3,
-            next_thought_needed=True,
             session_id=session_id,
         )
         server_with_logging.process_thought(request1)
 
         # Now branch from it
-        request2 = ThoughtRequest(
+        request2 = thought_request(
             thought="Branch thought",
             thought_number=2,
-            total_thoughts=3,
             next_thought_needed=False,
             branch_from_thought=1,
             branch_id="branch-a",
@@ -91,14 +112,13 @@ class TestLogging:
         assert isinstance(response, ThoughtResponse)
 
     def test_format_and_log_with_uncertainty_notes(
-        self, server_with_logging: UltraThinkService
+        self,
+        server_with_logging: UltraThinkService,
+        thought_request: Callable[..., ThoughtRequest],
     ) -> None:
         """Should format and log thoughts with uncertainty_notes"""
-        request = ThoughtRequest(
+        request = thought_request(
             thought="Test thought with uncertainty",
-            thought_number=1,
-            total_thoughts=3,
-            next_thought_needed=True,
             confidence=0.7,
             uncertainty_notes="Not sure about edge cases",
         )
@@ -108,14 +128,13 @@ class TestLogging:
         assert response.uncertainty_notes == "Not sure about edge cases"
 
     def test_format_and_log_with_outcome(
-        self, server_with_logging: UltraThinkService
+        self,
+        server_with_logging: UltraThinkService,
+        thought_request: Callable[..., ThoughtRequest],
     ) -> None:
         """Should format and log thoughts with outcome"""
-        request = ThoughtRequest(
+        request = thought_request(
             thought="Test thought with outcome",
-            thought_number=1,
-            total_thoughts=3,
-            next_thought_needed=True,
             outcome="Bug fixed successfully",
         )
 
@@ -124,14 +143,13 @@ class TestLogging:
         assert response.outcome == "Bug fixed successfully"
 
     def test_format_and_log_with_both_new_fields(
-        self, server_with_logging: UltraThinkService
+        self,
+        server_with_logging: UltraThinkService,
+        thought_request: Callable[..., ThoughtRequest],
     ) -> None:
         """Should format and log thoughts with both uncertainty_notes and outcome"""
-        request = ThoughtRequest(
+        request = thought_request(
             thought="Test thought with both new fields",
-            thought_number=1,
-            total_thoughts=3,
-            next_thought_needed=True,
             confidence=0.85,
             uncertainty_notes="Need more testing",
             outcome="Partial success",
@@ -144,11 +162,9 @@ class TestLogging:
         assert response.outcome == "Partial success"
 
     def test_update_assumption_with_logging_enabled(
-        self, server_with_logging: UltraThinkService
+        self, server_with_logging: UltraThinkService, session_id: str
     ) -> None:
         """Should log when updating assumption verification fields with logging enabled"""
-        session_id = "test-session"
-
         # First thought creates assumption
         request1 = ThoughtRequest(
             thought="Initial assumption",
@@ -186,11 +202,6 @@ class TestLogging:
 class TestAssumptionTracking:
     """Test suite for assumption tracking functionality"""
 
-    @pytest.fixture
-    def service(self) -> UltraThinkService:
-        """Create a service instance"""
-        return UltraThinkService()
-
     def test_add_assumption_to_thought(self, service: UltraThinkService) -> None:
         """Should track assumptions added to thoughts"""
         assumption = Assumption(
@@ -227,11 +238,9 @@ class TestAssumptionTracking:
         assert "A2" in response.all_assumptions
 
     def test_assumptions_persist_across_thoughts(
-        self, service: UltraThinkService
+        self, service: UltraThinkService, session_id: str
     ) -> None:
         """Should persist assumptions across multiple thoughts in same session"""
-        session_id = "test-session"
-
         # First thought with assumption
         request1 = ThoughtRequest(
             thought="Initial thought",
@@ -251,10 +260,10 @@ class TestAssumptionTracking:
         response2 = service.process_thought(request2)
         assert "A1" in response2.all_assumptions  # Should still be there
 
-    def test_depends_on_assumptions(self, service: UltraThinkService) -> None:
+    def test_depends_on_assumptions(
+        self, service: UltraThinkService, session_id: str
+    ) -> None:
         """Should track assumption dependencies"""
-        session_id = "test-session"
-
         # First thought with assumptions
         request1 = ThoughtRequest(
             thought="Initial thought",
@@ -289,6 +298,25 @@ class TestAssumptionTracking:
         assert "Cannot depend on assumption A99" in str(exc_info.value)
         assert "assumption not found" in str(exc_info.value)
 
+    def test_depends_on_reports_first_missing_assumption(self) -> None:
+        """Should name the first missing local dependency and record nothing"""
+        from ultrathink.models.session import ThinkingSession
+        from ultrathink.models.thought import Thought
+
+        session = ThinkingSession(disable_logging=True)
+        thought = Thought(
+            thought="Test thought",
+            thought_number=1,
+            total_thoughts=1,
+            next_thought_needed=False,
+            depends_on_assumptions=["other:A1", "A7", "A3"],
+        )
+
+        with pytest.raises(ValueError, match="Cannot depend on assumption A7"):
+            session.add_thought(thought)
+        assert session.unresolved_references == []
+        assert session.thought_count == 0
+
     def test_invalidate_nonexistent_assumption_error(
         self, service: UltraThinkService
     ) -> None:
@@ -304,10 +332,10 @@ class TestAssumptionTracking:
         assert "Cannot invalidate assumption A99" in str(exc_info.value)
         assert "assumption not found" in str(exc_info.value)
 
-    def test_invalidate_assumption(self, service: UltraThinkService) -> None:
+    def test_invalidate_assumption(
+        self, service: UltraThinkService, session_id: str
+    ) -> None:
         """Should mark assumptions as falsified when invalidated"""
-        session_id = "test-session"
-
         # First thought with assumption
         request1 = ThoughtRequest(
             thought="Assuming dataset is small",
@@ -386,10 +414,10 @@ class TestAssumptionTracking:
         response = service.process_thought(request)
         assert len(response.risky_assumptions) == 0
 
-    def test_update_existing_assumption(self, service: UltraThinkService) -> None:
+    def test_update_existing_assumption(
+        self, service: UltraThinkService, session_id: str
+    ) -> None:
         """Should update verification fields when core fields match"""
-        session_id = "test-session"
-
         # First thought with assumption
         request1 = ThoughtRequest(
             thought="Initial thought",
@@ -438,10 +466,10 @@ class TestAssumptionTracking:
         assert response.all_assumptions["A1"].verification_status == "verified_true"
         assert "A1" not in response.falsified_assumptions
 
-    def test_get_affected_thoughts(self, service: UltraThinkService) -> None:
+    def test_get_affected_thoughts(
+        self, service: UltraThinkService, session_id: str
+    ) -> None:
         """Should find all thoughts that depend on a given assumption"""
-        session_id = "test-session"
-
         # T1: Add assumption A1
         request1 = ThoughtRequest(
             thought="Adding assumption A1",
@@ -486,15 +514,84 @@ class TestAssumptionTracking:
         affected_none = session.get_affected_thoughts("A99")
         assert affected_none == []
 
+    def test_risky_and_falsified_lists_follow_updates(
+        self, service: UltraThinkService, session_id: str
+    ) -> None:
+        """Should refresh cached risky/falsified IDs when assumptions change"""
+        service.process_thought(
+            ThoughtRequest(
+                thought="Adding risky assumptions",
+                total_thoughts=3,
+                session_id=session_id,
+                assumptions=[
+                    Assumption(id="A1", text="Cache hit rate > 90%", confidence=0.5),
+                    Assumption(id="A2", text="Traffic is steady", confidence=0.6),
+                ],
+            )
+        )
+        session = service._sessions[session_id]
+        risky = session.risky_assumptions
+        assert risky == ["A1", "A2"]
+        risky.clear()
+        assert session.risky_assumptions == ["A1", "A2"]
+
+        session.verify_assumption("A1", is_true=True)
+        assert session.risky_assumptions == ["A2"]
+        assert session.falsified_assumptions == []
+
+        response = service.process_thought(
+            ThoughtRequest(
+                thought="Traffic is bursty",
+                total_thoughts=3,
+                session_id=session_id,
+                invalidates_assumptions=["A2"],
+            )
+        )
+        assert response.falsified_assumptions == ["A2"]
+        assert response.risky_assumptions == ["A2"]
+
+    def test_get_affected_thoughts_skips_duplicates_and_rejected(
+        self, service: UltraThinkService, session_id: str
+    ) -> None:
+        """Should list each dependent thought once and ignore rejected thoughts"""
+        service.process_thought(
+            ThoughtRequest(
+                thought="Adding assumption A1",
+                total_thoughts=3,
+                session_id=session_id,
+                assumptions=[Assumption(id="A1", text="Dataset < 1GB")],
+            )
+        )
+        service.process_thought(
+            ThoughtRequest(
+                thought="Using A1 twice",
+                total_thoughts=3,
+                session_id=session_id,
+                depends_on_assumptions=["A1", "A1"],
+            )
+        )
+        with pytest.raises(ValueError):
+            service.process_thought(
+                ThoughtRequest(
+                    thought="Depends on A1 and a missing assumption",
+                    total_thoughts=3,
+                    session_id=session_id,
+                    depends_on_assumptions=["A1", "A2"],
+                )
+            )
+
+        session = service._sessions[session_id]
+        assert session.get_affected_thoughts("A1") == [2]
+
     def test_multiple_sessions_isolated_assumptions(
-        self, service: UltraThinkService
+        self, service: UltraThinkService, session_id: str
     ) -> None:
         """Should keep assumptions isolated between different sessions"""
         # Session 1
         request1 = ThoughtRequest(
             thought="Session 1 thought",
             total_thoughts=3,
-            session_id="session-1",
+            session_id=f"{session_id}-1",
             assumptions=[Assumption(id="A1", text="Session 1 assumption")],
         )
         response1 = service.process_thought(request1)
@@ -504,7 +601,7 @@ class TestAssumptionTracking:
         request2 = ThoughtRequest(
             thought="Session 2 thought",
             total_thoughts=3,
-            session_id="session-2",
+            session_id=f"{session_id}-2",
             assumptions=[Assumption(id="A2", text="Session 2 assumption")],
         )
         response2 = service.process_thought(request2)
@@ -532,11 +629,9 @@ class TestAssumptionTracking:
         assert isinstance(response, ThoughtResponse)
 
     def test_update_assumption_verification_fields(
-        self, service: UltraThinkService
+        self, service: UltraThinkService, session_id: str
     ) -> None:
         """Should allow updating verification-related fields when core fields match"""
-        session_id = "test-session"
-
         # First thought creates assumption
         request1 = ThoughtRequest(
             thought="Initial assumption",
@@ -580,11 +675,9 @@ class TestAssumptionTracking:
         assert response2.all_assumptions["A1"].evidence == "Verified in production"
 
     def test_update_assumption_text_mismatch_error(
-        self, service: UltraThinkService
+        self, service: UltraThinkService, session_id: str
     ) -> None:
         """Should raise error when updating assumption with different text"""
-        session_id = "test-session"
-
         # First thought creates assumption
         request1 = ThoughtRequest(
             thought="Initial assumption",
@@ -619,11 +712,9 @@ class TestAssumptionTracking:
         assert "immutable" in str(exc_info.value)
 
     def test_update_assumption_critical_mismatch_error(
-        self, service: UltraThinkService
+        self, service: UltraThinkService, session_id: str
     ) -> None:
         """Should raise error when updating assumption with different critical flag"""
-        session_id = "test-session"
-
         # First thought creates assumption
         request1 = ThoughtRequest(
             thought="Initial assumption",
@@ -694,18 +785,9 @@ class TestAssumptionTracking:
 class TestCrossSessionReferences:
     """Test suite for cross-session assumption references"""
 
-    @pytest.fixture
-    def service(self) -> Generator[UltraThinkService, None, None]:
-        """Create a service instance with logging disabled"""
-        os.environ["DISABLE_THOUGHT_LOGGING"] = "true"
-        server = UltraThinkService()
-        yield server
-        if "DISABLE_THOUGHT_LOGGING" in os.environ:
-            del os.environ["DISABLE_THOUGHT_LOGGING"]
-
     def test_parse_assumption_id_local(self) -> None:
         """Test parsing local assumption ID"""
-        from ultrathink.models.session import _parse_assumption_id
+        from ultrathink.services.thinking_service import _parse_assumption_id
 
         session_id, local_id = _parse_assumption_id("A1")
         assert session_id is None
@@ -713,12 +795,20 @@ class TestCrossSessionReferences:
 
     def test_parse_assumption_id_scoped(self) -> None:
         """Test parsing scoped assumption ID"""
-        from ultrathink.models.session import _parse_assumption_id
+        from ultrathink.services.thinking_service import _parse_assumption_id
 
         session_id, local_id = _parse_assumption_id("session-123:A1")
         assert session_id == "session-123"
         assert local_id == "A1"
 
+    def test_parse_assumption_id_splits_on_first_colon(self) -> None:
+        """Test that only the first colon separates session from local ID"""
+        from ultrathink.services.thinking_service import _parse_assumption_id
+
+        session_id, local_id = _parse_assumption_id("session-123:A1:extra")
+        assert session_id == "session-123"
+        assert local_id == "A1:extra"
+
     def test_cross_session_reference_unresolved(
         self, service: UltraThinkService
     ) -> None:
@@ -733,9 +823,7 @@ class TestCrossSessionReferences:
         response = service.process_thought(request)
         assert "nonexistent:A1" in response.unresolved_references
 
-    def test_invalidate_cross_session_warning(
-        self, service: UltraThinkService
-    ) -> None:
+    def test_invalidate_cross_session_warning(self, service: UltraThinkService) -> None:
         """Test warning when trying to invalidate cross-session assumption"""
         request = ThoughtRequest(
             thought="Try to invalidate other session",
@@ -745,7 +833,34 @@ class TestCrossSessionReferences:
 
         response = service.process_thought(request)
         assert len(response.cross_session_warnings) > 0
-        assert "cross-session invalidation not supported" in response.cross_session_warnings[0]
+        assert (
+            "cross-session invalidation not supported"
+            in response.cross_session_warnings[0]
+        )
+
+    def test_assumptions_view_is_live_and_read_only(
+        self, service: UltraThinkService
+    ) -> None:
+        """Test assumptions_view reflects updates without allowing mutation"""
+        from ultrathink.models.session import ThinkingSession
+        from ultrathink.models.thought import Thought
+
+        session = ThinkingSession(disable_logging=True)
+        view = session.assumptions_view
+        assert len(view) == 0
+
+        session.add_thought(
+            Thought(
+                thought="Test",
+                thought_number=1,
+                total_thoughts=1,
+                next_thought_needed=False,
+                assumptions=[Assumption(id="A1", text="Input is sorted")],
+            )
+        )
+        assert list(view) == ["A1"]
+        with pytest.raises(TypeError):
+            view["A2"] = Assumption(id="A2", text="Input is small")  # type: ignore[index]
 
     def test_unresolved_references_property(self, service: UltraThinkService) -> None:
         """Test unresolved_references property returns copy from session"""
@@ -772,6 +887,29 @@ class TestCrossSessionReferences:
         assert unresolved1 == unresolved2
         assert unresolved1 is not unresolved2
 
+    def test_unresolved_references_recorded_once(
+        self, service: UltraThinkService
+    ) -> None:
+        """Test repeated unresolved references are recorded once, in order"""
+        from ultrathink.models.session import ThinkingSession
+        from ultrathink.models.thought import Thought
+
+        session = ThinkingSession(disable_logging=True)
+        for number, refs in enumerate(
+            [["other:A2", "other:A1"], ["other:A1", "other:A2", "other:A3"]], start=1
+        ):
+            session.add_thought(
+                Thought(
+                    thought=f"Thought {number}",
+                    thought_number=number,
+                    total_thoughts=2,
+                    next_thought_needed=number < 2,
+                    depends_on_assumptions=refs,
+                )
+            )
+
+        assert session.unresolved_references == ["other:A2", "other:A1", "other:A3"]
+
     def test_cross_session_warnings_property(self, service: UltraThinkService) -> None:
         """Test cross_session_warnings property returns copy from session"""
         from ultrathink.models.session import ThinkingSession
@@ -796,3 +934,50 @@ class TestCrossSessionReferences:
         # Should be equal but not same object (copy)
         assert warnings1 == warnings2
         assert warnings1 is not warnings2
+
+
+class TestBranchTracking:
+    """Test suite for branch bookkeeping in ThinkingSession"""
+
+    def test_branches_group_thoughts_by_interned_id(self) -> None:
+        """Should group branch thoughts under the interned branch ID"""
+        from ultrathink.models.session import ThinkingSession
+        from ultrathink.models.thought import Thought
+
+        session = ThinkingSession(disable_logging=True)
+        session.add_thought(
+            Thought(
+                thought="Root",
+                thought_number=1,
+                total_thoughts=3,
+                next_thought_needed=True,
+            )
+        )
+        for number in (2, 3):
+            session.add_thought(
+                Thought(
+                    thought=f"Branch thought {number}",
+                    thought_number=number,
+                    total_thoughts=3,
+                    next_thought_needed=number < 3,
+                    branch_from_thought=1,
+                    branch_id="".join(list("branch-a")),
+                )
+            )
+
+        assert session.branch_ids == ["branch-a"]
+        assert session.branch_ids[0] is sys.intern("branch-a")
+        assert [t.thought_number for t in session._branches["branch-a"]] == [2, 3]
+
+
+class TestSessionLayout:
+    """Test suite for ThinkingSession instance layout"""
+
+    def test_session_has_no_instance_dict(self) -> None:
+        """Should store session state in slots rather than a per-instance dict"""
+        from ultrathink.models.session import ThinkingSession
+
+        session = ThinkingSession(disable_logging=True)
+        assert not hasattr(session, "__dict__")
+        with pytest.raises(AttributeError):
+            session.unexpected = True  # type: ignore[attr-defined]
@@ -1,5 +1,15 @@
+import sys
+from typing import Any
+
 import pytest
-from ultrathink.models.thought import Thought
+from pydantic import ValidationError
+from ultrathink.models.assumption import Assumption
+from ultrathink.models.thought import Thought, ThoughtRequest, ThoughtResponse
+
+
+def _runtime_str(value: str) -> str:
+    """Build an equal string at runtime, so it is not the interned literal"""
+    return "".join(list(value))
 
 
 class TestThought:
@@ -47,6 +57,33 @@ class TestThought:
         )
         assert regular_thought.is_branch is False
 
+        # Branch point without a usable branch ID
+        unnamed_branch = Thought(
+            thought="Unnamed branch",
+            thought_number=2,
+            total_thoughts=3,
+            next_thought_needed=True,
+            branch_from_thought=1,
+            branch_id="",
+        )
+        assert unnamed_branch.is_branch is False
+
+    def test_kind_properties_are_cached_outside_fields(self) -> None:
+        """Should cache is_branch/is_final without adding them to the model data"""
+        thought = Thought(
+            thought="Branch",
+            thought_number=2,
+            total_thoughts=2,
+            next_thought_needed=False,
+            branch_from_thought=1,
+            branch_id="alt",
+        )
+
+        assert thought.is_branch is True
+        assert thought.is_final is True
+        assert {"is_branch", "is_final"}.isdisjoint(thought.model_dump())
+        assert thought == thought.model_copy()
+
     def test_auto_adjust_total(self) -> None:
         """Should auto-adjust total_thoughts when thought_number exceeds it"""
         thought = Thought(
@@ -56,12 +93,17 @@ class TestThought:
             next_thought_needed=True,
         )
 
-        # Before adjustment
-        assert thought.total_thoughts == 3
-
-        # After adjustment
-        thought.auto_adjust_total()
         assert thought.total_thoughts == 5
+        assert "5/5" in thought.format()
+
+        # Trusted construction is adjusted the same way
+        constructed = Thought.model_construct(
+            thought="Thought 5",
+            thought_number=5,
+            total_thoughts=3,
+            next_thought_needed=True,
+        )
+        assert constructed.total_thoughts == 5
 
     def test_auto_adjust_total_no_change_when_within_range(self) -> None:
         """Should not adjust total_thoughts when thought_number is within range"""
@@ -72,9 +114,157 @@ class TestThought:
             next_thought_needed=True,
         )
 
-        thought.auto_adjust_total()
         assert thought.total_thoughts == 5
 
+    def test_branch_id_is_interned(self) -> None:
+        """Should intern branch_id however the thought is constructed"""
+        for build in (Thought, Thought.model_construct):
+            thought = build(
+                thought="Branch thought",
+                thought_number=2,
+                total_thoughts=3,
+                next_thought_needed=True,
+                branch_from_thought=1,
+                branch_id=_runtime_str("branch-a"),
+            )
+            assert thought.branch_id is sys.intern("branch-a")
+
+    def test_validate_references_lists_available_thoughts(self) -> None:
+        """Should list available thoughts, truncated for long sessions"""
+        thought = Thought(
+            thought="Revision",
+            thought_number=3,
+            total_thoughts=3,
+            next_thought_needed=False,
+            is_revision=True,
+            revises_thought=99,
+        )
+
+        with pytest.raises(ValueError, match=r"Available thoughts: \[1, 2\]$"):
+            thought.validate_references({2, 1})
+        with pytest.raises(
+            ValueError,
+            match=r"Available thoughts: \[1, 2, 3, 4, 5, \.\.\., 16, 17, 18, 19, 20\]$",
+        ):
+            thought.validate_references(set(range(1, 21)))
+
+    def test_format_is_cached(self) -> None:
+        """Should return the same formatted string on repeated calls"""
+        thought = Thought(
+            thought="Cached thought",
+            thought_number=1,
+            total_thoughts=3,
+            next_thought_needed=True,
+        )
+
+        assert thought.format() is thought.format()
+
+    def test_formatted_thought_equals_unformatted(self) -> None:
+        """Should compare equal whether or not format() has run"""
+        fields: dict[str, Any] = {
+            "thought": "Logged thought",
+            "thought_number": 1,
+            "total_thoughts": 3,
+            "next_thought_needed": True,
+            "assumptions": [Assumption(id="A1", text="Cached")],
+        }
+        formatted = Thought(**fields)
+        formatted.format()
+
+        assert formatted == Thought(**fields)
+        assert formatted == formatted.model_copy()
+
+    def test_model_copy_update_rebuilds_format(self) -> None:
+        """Should not carry a stale format() output into an updated copy"""
+        thought = Thought(
+            thought="Copied",
+            thought_number=2,
+            total_thoughts=3,
+            next_thought_needed=True,
+        )
+        assert "2/3" in thought.format()
+
+        copied = thought.model_copy(update={"total_thoughts": 9})
+
+        assert "2/9" in copied.format()
+        assert "2/3" in thought.format()
+
+    def test_model_copy_update_recomputes_properties(self) -> None:
+        """Should recompute is_branch and is_final on an updated copy"""
+        branch = Thought(
+            thought="Branch",
+            thought_number=2,
+            total_thoughts=3,
+            next_thought_needed=True,
+            branch_from_thought=1,
+            branch_id="branch-a",
+        )
+        assert branch.is_branch and not branch.is_final
+
+        copied = branch.model_copy(
+            update={"branch_id": None, "next_thought_needed": False}
+        )
+
+        assert not copied.is_branch
+        assert copied.is_final
+
+    def test_model_copy_update_adjusts_total_and_interns_branch_id(self) -> None:
+        """Should re-apply the post-init adjustments to an updated copy"""
+        thought = Thought(
+            thought="Copied",
+            thought_number=1,
+            total_thoughts=3,
+            next_thought_needed=True,
+        )
+        branch_id = _runtime_str("branch-copied")
+
+        copied = thought.model_copy(
+            update={
+                "thought_number": 7,
+                "branch_from_thought": 1,
+                "branch_id": branch_id,
+            }
+        )
+
+        assert copied.total_thoughts == 7
+        assert copied.branch_id is sys.intern(branch_id)
+
+    def test_from_request_matches_validated_thought(self) -> None:
+        """Should build the same thought as validating the request's fields"""
+        request = ThoughtRequest(
+            thought="From request",
+            total_thoughts=4,
+            session_id="session-1",
+            branch_from_thought=1,
+            branch_id="branch-a",
+            confidence=0.6,
+            assumptions=[Assumption(id="A1", text="Cached")],
+            depends_on_assumptions=["A1"],
+        )
+
+        thought = Thought.from_request(request, 2, True)
+
+        assert thought == Thought(
+            **request.model_dump(
+                exclude={"session_id", "thought_number", "next_thought_needed"}
+            ),
+            thought_number=2,
+            next_thought_needed=True,
+        )
+        assert thought.assumptions is request.assumptions
+
+    def test_thought_is_immutable(self) -> None:
+        """Should reject attribute assignment after construction"""
+        thought = Thought(
+            thought="Thought 2",
+            thought_number=2,
+            total_thoughts=3,
+            next_thought_needed=True,
+        )
+
+        with pytest.raises(ValidationError):
+            thought.total_thoughts = 4
+
     def test_format_regular_thought(self) -> None:
         """Should format regular thoughts with correct emoji and color"""
         thought = Thought(
@@ -263,6 +453,25 @@ class TestThought:
         assert "💭 Thought" in formatted
         assert "1/3" in formatted
 
+    def test_format_pads_lines_to_border_width(self) -> None:
+        """Should pad the thought line one column wider than metadata lines"""
+        thought = Thought(
+            thought="Short",
+            thought_number=1,
+            total_thoughts=3,
+            next_thought_needed=True,
+            outcome="A much longer outcome line sets the width",
+            depends_on_assumptions=["A1"],
+        )
+
+        lines = thought.format().removeprefix("[blue]").removesuffix("[/blue]")
+        top, header, separator, content, outcome, depends, bottom = lines.split("\n")
+        width = len(top)
+        assert len(separator) == len(bottom) == width
+        assert len(header) == len(outcome) == len(depends) == width - 1
+        assert len(content) == width
+        assert content == f"│ {'Short'.ljust(width - 3)}│"
+
     def test_format_thought_without_new_fields(self) -> None:
         """Should format thought correctly when new fields are not provided (backward compat)"""
         thought = Thought(
@@ -503,3 +712,92 @@ class TestThoughtJsonStringParsing:
 
         formatted = thought.format()
         assert "❌ Invalidates: A1" in formatted
+
+
+class TestThoughtRequest:
+    """Test suite for ThoughtRequest model"""
+
+    def test_request_is_immutable(self) -> None:
+        """Should reject attribute assignment after construction"""
+        request = ThoughtRequest(thought="Frozen", total_thoughts=1)
+
+        with pytest.raises(ValidationError):
+            request.total_thoughts = 2
+
+    def test_identifiers_are_interned(self) -> None:
+        """Should intern session_id and branch_id"""
+        session_id = _runtime_str("session-abc")
+        branch_id = _runtime_str("branch-a")
+
+        request = ThoughtRequest(
+            thought="Test",
+            total_thoughts=3,
+            session_id=session_id,
+            branch_id=branch_id,
+        )
+
+        assert request.session_id is sys.intern("session-abc")
+        assert request.branch_id is sys.intern("branch-a")
+
+    def test_from_tool_arguments_reuses_validated_values(self) -> None:
+        """Should build the request without re-validating list arguments"""
+        assumptions = [Assumption(id="A1", text="Input is sorted")]
+
+        request = ThoughtRequest.from_tool_arguments(
+            thought="Test",
+            total_thoughts=3,
+            session_id=_runtime_str("session-abc"),
+            assumptions=assumptions,
+            depends_on_assumptions=None,
+        )
+
+        assert request.assumptions is assumptions
+        assert request.session_id is sys.intern("session-abc")
+        assert request.branch_id is None
+        assert request.thought_number is None
+
+    def test_from_tool_arguments_parses_json_strings(self) -> None:
+        """Should fall back to full validation when a list field is a JSON string"""
+        request = ThoughtRequest.from_tool_arguments(
+            thought="Test",
+            total_thoughts=3,
+            assumptions=None,
+            depends_on_assumptions='["A1", "A2"]',
+        )
+
+        assert request.depends_on_assumptions == ["A1", "A2"]
+
+    def test_from_tool_arguments_validates_json_strings(self) -> None:
+        """Should reject invalid JSON strings on the validating path"""
+        with pytest.raises(ValueError, match="must be valid JSON"):
+            ThoughtRequest.from_tool_arguments(
+                thought="Test",
+                total_thoughts=3,
+                invalidates_assumptions="not json",
+            )
+
+    def test_missing_identifiers_stay_none(self) -> None:
+        """Should leave omitted identifiers as None"""
+        request = ThoughtRequest(thought="Test", total_thoughts=3)
+
+        assert request.session_id is None
+        assert request.branch_id is None
+
+
+class TestThoughtResponse:
+    """Test suite for ThoughtResponse model"""
+
+    def test_response_is_immutable(self) -> None:
+        """Should reject attribute assignment after construction"""
+        response = ThoughtResponse(
+            session_id="session-1",
+            thought_number=1,
+            total_thoughts=1,
+            next_thought_needed=False,
+            branches=[],
+            thought_history_length=1,
+            all_assumptions={},
+        )
+
+        with pytest.raises(ValidationError):
+            response.thought_number = 2
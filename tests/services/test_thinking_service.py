@@ -1,4 +1,4 @@
-import os
+import sys
 from typing import Generator
 import pytest
 from pydantic import ValidationError
@@ -13,8 +13,20 @@ class TestUltraThinkService:
     @pytest.fixture
     def server(self) -> Generator[UltraThinkService, None, None]:
         """Create a server instance with logging disabled for tests"""
-        os.environ["DISABLE_THOUGHT_LOGGING"] = "true"
-        yield UltraThinkService()
+        yield UltraThinkService(disable_logging=True)
+
+    def test_logging_flag_defaults_to_environment_setting(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should fall back to DISABLE_THOUGHT_LOGGING as read at import"""
+        from ultrathink.services import thinking_service
+
+        monkeypatch.setattr(thinking_service, "_DISABLE_LOGGING", True)
+        assert UltraThinkService()._disable_logging is True
+        assert UltraThinkService(disable_logging=False)._disable_logging is False
+
+        monkeypatch.setattr(thinking_service, "_DISABLE_LOGGING", False)
+        assert UltraThinkService()._disable_logging is False
 
     # Validation tests
     def test_reject_missing_thought(self, server: UltraThinkService) -> None:
@@ -1052,6 +1064,171 @@ class TestUltraThinkService:
         assert response.uncertainty_notes is None
         assert response.outcome is None
 
+    def test_session_ids_are_interned(self, server: UltraThinkService) -> None:
+        """Should register sessions under interned IDs"""
+        generated = server.process_thought(
+            ThoughtRequest(thought="New session", total_thoughts=1)
+        )
+        custom_id = "".join(list("custom-session"))
+        custom = server.process_thought(
+            ThoughtRequest.model_construct(
+                thought="Custom session", total_thoughts=1, session_id=custom_id
+            )
+        )
+
+        assert generated.session_id is sys.intern(generated.session_id)
+        assert custom.session_id is sys.intern("custom-session")
+
+    def test_least_recently_used_session_is_evicted(self) -> None:
+        """Should drop the least recently used session beyond max_sessions"""
+        server = UltraThinkService(disable_logging=True, max_sessions=2)
+        for session_id in ("s1", "s2", "s1", "s3"):
+            server.process_thought(
+                ThoughtRequest(
+                    thought=f"Thought in {session_id}",
+                    total_thoughts=3,
+                    session_id=session_id,
+                )
+            )
+
+        # s2 was used least recently once s1 was continued
+        assert list(server._sessions) == ["s1", "s3"]
+        assert server._sessions["s1"].thought_count == 2
+
+    def test_rejected_request_keeps_existing_sessions(self) -> None:
+        """Should not register or evict anything for a rejected new session"""
+        server = UltraThinkService(disable_logging=True, max_sessions=1)
+        server.process_thought(
+            ThoughtRequest(thought="Live thought", total_thoughts=3, session_id="live")
+        )
+
+        with pytest.raises(ValueError, match="revise thought 5"):
+            server.process_thought(
+                ThoughtRequest(
+                    thought="Bad revision",
+                    total_thoughts=3,
+                    session_id="new",
+                    is_revision=True,
+                    revises_thought=5,
+                )
+            )
+
+        assert list(server._sessions) == ["live"]
+        assert server._sessions["live"].thought_count == 1
+
+    def test_cross_session_reference_refreshes_target_session(self) -> None:
+        """Should count a resolved cross-session reference as a use of its session"""
+        server = UltraThinkService(disable_logging=True, max_sessions=2)
+        server.process_thought(
+            ThoughtRequest(
+                thought="Shared assumption",
+                total_thoughts=3,
+                session_id="shared",
+                assumptions=[Assumption(id="A1", text="Input is sorted")],
+            )
+        )
+        server.process_thought(
+            ThoughtRequest(thought="Reader", total_thoughts=3, session_id="reader")
+        )
+        server.process_thought(
+            ThoughtRequest(
+                thought="Reads the shared assumption",
+                total_thoughts=3,
+                session_id="reader",
+                depends_on_assumptions=["shared:A1"],
+            )
+        )
+        server.process_thought(
+            ThoughtRequest(thought="Newcomer", total_thoughts=3, session_id="new")
+        )
+
+        # reader was used before shared was last referenced, so it is evicted
+        assert list(server._sessions) == ["shared", "new"]
+
+    def test_max_sessions_defaults_to_environment_setting(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should fall back to ULTRATHINK_MAX_SESSIONS as read at import"""
+        from ultrathink.services import thinking_service
+
+        monkeypatch.setattr(thinking_service, "_MAX_SESSIONS", 1)
+        server = UltraThinkService(disable_logging=True)
+        server.process_thought(ThoughtRequest(thought="First", total_thoughts=1))
+        response = server.process_thought(
+            ThoughtRequest(thought="Second", total_thoughts=1)
+        )
+
+        assert list(server._sessions) == [response.session_id]
+
+    def test_max_sessions_environment_setting_is_parsed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should read ULTRATHINK_MAX_SESSIONS, defaulting when unset or empty"""
+        from ultrathink.services.thinking_service import _read_max_sessions
+
+        monkeypatch.delenv("ULTRATHINK_MAX_SESSIONS", raising=False)
+        assert _read_max_sessions() == 1024
+        monkeypatch.setenv("ULTRATHINK_MAX_SESSIONS", "")
+        assert _read_max_sessions() == 1024
+        monkeypatch.setenv("ULTRATHINK_MAX_SESSIONS", " 8 ")
+        assert _read_max_sessions() == 8
+
+    def test_max_sessions_environment_setting_rejects_non_integer(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should warn and fall back to the default for a non-integer setting"""
+        from ultrathink.services.thinking_service import _read_max_sessions
+
+        monkeypatch.setenv("ULTRATHINK_MAX_SESSIONS", "lots")
+        with pytest.warns(RuntimeWarning, match="must be an integer, got 'lots'"):
+            assert _read_max_sessions() == 1024
+
+    def test_max_sessions_environment_setting_is_at_least_one(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should warn and keep one session for a zero or negative setting"""
+        from ultrathink.services.thinking_service import _read_max_sessions
+
+        for value in ("0", "-5"):
+            monkeypatch.setenv("ULTRATHINK_MAX_SESSIONS", value)
+            with pytest.warns(RuntimeWarning, match="must be at least 1"):
+                assert _read_max_sessions() == 1
+
+    def test_max_sessions_argument_must_be_positive(self) -> None:
+        """Should reject a max_sessions argument below 1"""
+        for max_sessions in (0, -1):
+            with pytest.raises(ValueError, match="max_sessions must be at least 1"):
+                UltraThinkService(disable_logging=True, max_sessions=max_sessions)
+
+    def test_assumptions_are_not_revalidated(self, server: UltraThinkService) -> None:
+        """Should store the request's validated assumptions without copying them"""
+        assumption = Assumption(id="A1", text="Input is sorted", confidence=0.6)
+        request = ThoughtRequest(
+            thought="Binary search applies",
+            total_thoughts=2,
+            assumptions=[assumption],
+        )
+
+        response = server.process_thought(request)
+
+        assert response.all_assumptions["A1"] is assumption
+
+    def test_response_passes_validation(self, server: UltraThinkService) -> None:
+        """Should build responses that the strict model would also accept"""
+        response = server.process_thought(
+            ThoughtRequest(
+                thought="Branch with assumptions",
+                total_thoughts=2,
+                confidence=0.4,
+                assumptions=[
+                    Assumption(id="A1", text="Input is sorted", confidence=0.3)
+                ],
+                depends_on_assumptions=["elsewhere:A1"],
+            )
+        )
+
+        assert ThoughtResponse.model_validate(dict(response)) == response
+
 
 class TestCrossSessionAssumptionReferences:
     """Test suite for cross-session assumption references"""
@@ -1059,11 +1236,7 @@ class TestCrossSessionAssumptionReferences:
     @pytest.fixture
     def service(self) -> Generator[UltraThinkService, None, None]:
         """Create service instance with logging disabled"""
-        os.environ["DISABLE_THOUGHT_LOGGING"] = "true"
-        server = UltraThinkService()
-        yield server
-        if "DISABLE_THOUGHT_LOGGING" in os.environ:
-            del os.environ["DISABLE_THOUGHT_LOGGING"]
+        yield UltraThinkService(disable_logging=True)
 
     def test_cross_session_assumption_reference_success(
         self, service: UltraThinkService
@@ -1190,13 +1363,18 @@ class TestCrossSessionAssumptionReferences:
 
         # Should have warning
         assert len(response2.cross_session_warnings) > 0
-        assert "cross-session invalidation not supported" in response2.cross_session_warnings[0]
+        assert (
+            "cross-session invalidation not supported"
+            in response2.cross_session_warnings[0]
+        )
 
     def test_resolve_cross_session_assumption_local_format(
         self, service: UltraThinkService
     ) -> None:
         """Test resolution method with local format"""
-        local_id, resolved = service._resolve_cross_session_assumption("A1", "session-1")
+        local_id, resolved = service._resolve_cross_session_assumption(
+            "A1", "session-1"
+        )
 
         # Local format should return as-is and be considered resolved
         assert local_id == "A1"
@@ -1235,3 +1413,90 @@ class TestCrossSessionAssumptionReferences:
         # Should resolve successfully
         assert local_id == "A1"
         assert resolved is True
+
+
+class TestProcessThoughts:
+    """Test suite for batch processing in UltraThinkService"""
+
+    @pytest.fixture
+    def server(self) -> Generator[UltraThinkService, None, None]:
+        """Create a server instance with logging disabled for tests"""
+        yield UltraThinkService(disable_logging=True)
+
+    def test_batch_continues_first_session(self, server: UltraThinkService) -> None:
+        """Should keep thoughts without session_id in the batch's current session"""
+        responses = server.process_thoughts(
+            [
+                ThoughtRequest(thought="Step 1", total_thoughts=3),
+                ThoughtRequest(thought="Step 2", total_thoughts=3),
+                ThoughtRequest(thought="Step 3", total_thoughts=3),
+            ]
+        )
+
+        assert [r.thought_number for r in responses] == [1, 2, 3]
+        assert len({r.session_id for r in responses}) == 1
+        assert responses[-1].thought_history_length == 3
+        assert responses[-1].next_thought_needed is False
+
+    def test_batch_respects_explicit_session_ids(
+        self, server: UltraThinkService
+    ) -> None:
+        """Should route thoughts with session_id to that session"""
+        responses = server.process_thoughts(
+            [
+                ThoughtRequest(thought="A1", total_thoughts=2, session_id="a"),
+                ThoughtRequest(thought="B1", total_thoughts=2, session_id="b"),
+                ThoughtRequest(thought="B2", total_thoughts=2),
+            ]
+        )
+
+        assert [r.session_id for r in responses] == ["a", "b", "b"]
+        assert [r.thought_history_length for r in responses] == [1, 1, 2]
+
+    def test_batch_stops_at_first_invalid_thought(
+        self, server: UltraThinkService
+    ) -> None:
+        """Should raise on an invalid thought and keep the ones before it"""
+        with pytest.raises(ValueError, match="Cannot revise thought 5"):
+            server.process_thoughts(
+                [
+                    ThoughtRequest(thought="Step 1", total_thoughts=3, session_id="s"),
+                    ThoughtRequest(
+                        thought="Bad revision",
+                        total_thoughts=3,
+                        is_revision=True,
+                        revises_thought=5,
+                    ),
+                ]
+            )
+
+        response = server.process_thought(
+            ThoughtRequest(thought="Step 2", total_thoughts=3, session_id="s")
+        )
+        assert response.thought_number == 2
+
+    def test_batch_accepts_raw_requests(self, server: UltraThinkService) -> None:
+        """Should validate raw request dicts and process them like models"""
+        responses = server.process_thoughts(
+            [
+                {"thought": "Step 1", "total_thoughts": 2, "session_id": "raw"},
+                ThoughtRequest(thought="Step 2", total_thoughts=2),
+            ]
+        )
+
+        assert [r.session_id for r in responses] == ["raw", "raw"]
+        assert [r.thought_number for r in responses] == [1, 2]
+
+    def test_batch_validates_raw_requests_before_processing(
+        self, server: UltraThinkService
+    ) -> None:
+        """Should reject an invalid raw request before recording any thought"""
+        with pytest.raises(ValidationError):
+            server.process_thoughts(
+                [
+                    {"thought": "Step 1", "total_thoughts": 2, "session_id": "raw"},
+                    {"thought": "Step 2", "total_thoughts": 0},
+                ]
+            )
+
+        assert "raw" not in server._sessions
@@ -1,14 +1,155 @@
 """Tests for CLI entry point"""
 
-from unittest.mock import patch
-from ultrathink.__main__ import main
+import asyncio
+import logging
+import os
+import sys
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import fastmcp
+import pytest
+from fastmcp import Client
+from fastmcp.utilities.logging import configure_logging
+from rich.logging import RichHandler
+
+from ultrathink.__main__ import _new_event_loop, main
+from ultrathink.interface.mcp_server import mcp
+
+
+def _rich_traceback_handlers() -> list[bool]:
+    """rich_tracebacks flag of each RichHandler on the fastmcp logger"""
+    return [
+        handler.rich_tracebacks
+        for handler in logging.getLogger("fastmcp").handlers
+        if isinstance(handler, RichHandler)
+    ]
 
 
 class TestCLIEntryPoint:
     """Test suite for CLI entry point"""
 
-    def test_main_function_calls_mcp_run(self) -> None:
-        """Should call mcp.run() when main() is invoked"""
-        with patch("ultrathink.interface.mcp_server.mcp.run") as mock_run:
+    @pytest.fixture(autouse=True)
+    def restore_logging(self) -> Iterator[None]:
+        """Restore FastMCP logging after each test"""
+        yield
+        configure_logging(
+            level=fastmcp.settings.log_level,
+            enable_rich_tracebacks=fastmcp.settings.enable_rich_tracebacks,
+        )
+
+    def test_main_function_runs_mcp_server(self) -> None:
+        """Should run the MCP server (mcp.run_async()) when main() is invoked"""
+        with patch("ultrathink.interface.mcp_server.mcp.run_async") as mock_run:
+            main()
+            mock_run.assert_awaited_once()
+
+    def test_new_event_loop_uses_uvloop_when_available(self) -> None:
+        """Should build uvloop's event loop when uvloop is installed"""
+        fake_uvloop = MagicMock()
+        fake_loop = fake_uvloop.new_event_loop.return_value
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            assert _new_event_loop() is fake_loop
+
+        fake_loop.set_task_factory.assert_called_once_with(asyncio.eager_task_factory)
+
+    def test_new_event_loop_falls_back_without_uvloop(self) -> None:
+        """Should build asyncio's default event loop when uvloop is missing"""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            loop = _new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.BaseEventLoop)
+            assert loop.get_task_factory() is asyncio.eager_task_factory
+        finally:
+            loop.close()
+
+    def test_main_leaves_event_loop_policy_alone(self) -> None:
+        """Should not change the process-wide event loop policy"""
+        with (
+            patch.dict(sys.modules, {"uvloop": None}),
+            patch("asyncio.set_event_loop_policy") as mock_set_policy,
+            patch("ultrathink.interface.mcp_server.mcp.run_async"),
+        ):
+            main()
+            mock_set_policy.assert_not_called()
+
+    def test_main_enables_eager_task_factory(self) -> None:
+        """Should run the server on an event loop with the eager task factory"""
+        task_factories: list[Any] = []
+
+        async def serve() -> None:
+            task_factories.append(asyncio.get_running_loop().get_task_factory())
+
+        with (
+            patch.dict(sys.modules, {"uvloop": None}),
+            patch("ultrathink.interface.mcp_server.mcp.run_async", side_effect=serve),
+        ):
+            main()
+
+        assert task_factories == [asyncio.eager_task_factory]
+
+    def test_eager_tasks_complete_without_scheduling(self) -> None:
+        """Should finish a coroutine that never suspends as soon as it is created"""
+
+        async def no_await() -> int:
+            return 42
+
+        async def run() -> bool:
+            task = asyncio.create_task(no_await())
+            done = task.done()
+            await task
+            return done
+
+        with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+            assert runner.run(run()) is True
+
+    def test_tool_call_round_trip_on_server_loop(self) -> None:
+        """Should serve a real tool call through an in-memory client on main()'s loop"""
+        results: list[Any] = []
+
+        async def serve() -> None:
+            async with Client(mcp) as client:
+                results.append(
+                    await client.call_tool(
+                        "ultrathink",
+                        {"thought": "Eager round trip", "total_thoughts": 2},
+                    )
+                )
+
+        with (
+            patch.dict(sys.modules, {"uvloop": None}),
+            patch("ultrathink.interface.mcp_server.mcp.run_async", side_effect=serve),
+        ):
             main()
-            mock_run.assert_called_once()
+
+        [result] = results
+        assert result.structured_content["thought_number"] == 1
+        assert result.structured_content["next_thought_needed"] is True
+
+    def test_main_disables_rich_tracebacks(self) -> None:
+        """Should log tool errors with plain tracebacks by default"""
+        with (
+            patch.dict(os.environ),
+            patch.dict(sys.modules, {"uvloop": None}),
+            patch("ultrathink.interface.mcp_server.mcp.run_async"),
+        ):
+            os.environ.pop("FASTMCP_ENABLE_RICH_TRACEBACKS", None)
+            main()
+
+        # One handler has rich tracebacks off even without main(); check them all
+        handlers = _rich_traceback_handlers()
+        assert handlers
+        assert True not in handlers
+
+    def test_main_respects_rich_traceback_setting(self) -> None:
+        """Should keep FastMCP's logging when rich tracebacks are configured explicitly"""
+        with (
+            patch.dict(os.environ, {"FASTMCP_ENABLE_RICH_TRACEBACKS": "true"}),
+            patch.dict(sys.modules, {"uvloop": None}),
+            patch("ultrathink.interface.mcp_server.mcp.run_async"),
+            patch("ultrathink.__main__.configure_logging") as mock_configure,
+        ):
+            main()
+
+        mock_configure.assert_not_called()
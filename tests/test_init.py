@@ -0,0 +1,51 @@
+"""Tests for the package's lazy public exports"""
+
+import subprocess
+import sys
+
+import pytest
+
+import ultrathink
+from ultrathink.interface.mcp_server import mcp
+from ultrathink.models.assumption import Assumption
+from ultrathink.models.session import ThinkingSession
+from ultrathink.models.thought import Thought, ThoughtRequest, ThoughtResponse
+from ultrathink.services.thinking_service import UltraThinkService
+
+
+class TestPackageExports:
+    """Test suite for lazy re-exports in ultrathink/__init__.py"""
+
+    def test_exports_resolve_to_defining_modules(self) -> None:
+        """Should resolve every public name to the object in its own module"""
+        assert ultrathink.Assumption is Assumption
+        assert ultrathink.Thought is Thought
+        assert ultrathink.ThoughtRequest is ThoughtRequest
+        assert ultrathink.ThoughtResponse is ThoughtResponse
+        assert ultrathink.ThinkingSession is ThinkingSession
+        assert ultrathink.UltraThinkService is UltraThinkService
+        assert ultrathink.mcp is mcp
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Should raise AttributeError for names that are not exported"""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = ultrathink.missing
+
+    def test_dir_lists_exports(self) -> None:
+        """Should list each lazy export in dir() once, even after it is loaded"""
+        _ = ultrathink.Thought  # cached into the module globals on access
+
+        names = dir(ultrathink)
+
+        assert set(ultrathink.__all__) <= set(names)
+        assert len(names) == len(set(names))
+
+    def test_import_does_not_load_server(self) -> None:
+        """Should not import FastMCP when only models are used"""
+        code = (
+            "import sys\n"
+            "from ultrathink import ThoughtRequest\n"
+            "assert 'fastmcp' not in sys.modules\n"
+            "assert 'ultrathink.interface.mcp_server' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)